@@ -332,6 +332,15 @@ fn parse_pool_dict(dict: &Bound<'_, PyDict>, parsed: &mut DriverPoolSettings) ->
     if let Some(value) = dict.get_item("sqlite_busy_timeout")? {
         parsed.sqlite_busy_timeout = extract_optional_i32(&value)?;
     }
+    if let Some(value) = dict.get_item("sqlite_temp_store")? {
+        parsed.sqlite_temp_store = extract_optional_string(&value)?;
+    }
+    if let Some(value) = dict.get_item("sqlite_read_connections")? {
+        parsed.sqlite_read_connections = extract_optional_u32(&value)?;
+    }
+    if let Some(value) = dict.get_item("sqlite_statement_cache_capacity")? {
+        parsed.sqlite_statement_cache_capacity = extract_optional_u32(&value)?;
+    }
 
     // TLS settings
     if let Some(value) = dict.get_item("ssl_mode")? {
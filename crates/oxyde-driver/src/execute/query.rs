@@ -34,7 +34,7 @@ pub async fn execute_query_columnar(
 
     let profile = is_profiling_enabled();
     let handle = registry().get(pool_name).await?;
-    let pool = handle.clone_pool();
+    let pool = handle.clone_pool_for(sql);
 
     let start = Instant::now();
     let results = pool.query_columnar(sql, params, col_types).await?;
@@ -68,7 +68,7 @@ pub async fn execute_query_columnar_dedup(
     );
 
     let handle = registry().get(pool_name).await?;
-    let pool = handle.clone_pool();
+    let pool = handle.clone_pool_for(sql);
     pool.query_columnar_dedup(sql, params, col_types, relations)
         .await
 }
@@ -65,6 +65,12 @@
 //! - `synchronous=NORMAL` (balance speed/safety)
 //! - `cache_size=10000` (~10MB cache)
 //! - `busy_timeout=5000` (5s lock wait)
+//!
+//! # SQLite Read Pool
+//!
+//! With `sqlite_read_connections` set and WAL enabled, a file database gets a
+//! single-connection writer pool plus a read-only pool of that size. SELECTs
+//! outside transactions run on the read pool; writes and transactions use the writer.
 
 use once_cell::sync::OnceCell;
 use tracing::info;
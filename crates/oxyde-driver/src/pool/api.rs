@@ -3,7 +3,7 @@
 use sqlx::{
     mysql::{MySqlConnectOptions, MySqlPoolOptions, MySqlSslMode},
     postgres::{PgConnectOptions, PgPoolOptions, PgSslMode},
-    sqlite::{SqliteConnectOptions, SqlitePoolOptions},
+    sqlite::{SqliteConnectOptions, SqlitePool, SqlitePoolOptions},
 };
 use std::path::PathBuf;
 use std::str::FromStr;
@@ -43,7 +43,7 @@ async fn init_pool_inner(
         )));
     };
 
-    let pool = match backend {
+    let (pool, read_pool) = match backend {
         DatabaseBackend::Postgres => {
             let connect_opts = build_pg_connect_options(url, &settings)?;
             let pool_opts = apply_common_settings_pg(PgPoolOptions::new(), &settings);
@@ -51,7 +51,8 @@ async fn init_pool_inner(
                 .connect_with(connect_opts)
                 .await
                 .map(DbPool::Postgres)
-                .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))?
+                .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))
+                .map(|pool| (pool, None))?
         }
         DatabaseBackend::MySql => {
             let connect_opts = build_mysql_connect_options(url, &settings)?;
@@ -60,68 +61,39 @@ async fn init_pool_inner(
                 .connect_with(connect_opts)
                 .await
                 .map(DbPool::MySql)
-                .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))?
+                .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))
+                .map(|pool| (pool, None))?
         }
         DatabaseBackend::Sqlite => {
-            // Clone PRAGMA settings for use in after_connect closure
-            let journal_mode_opt = settings.sqlite_journal_mode.clone();
-            let synchronous_opt = settings.sqlite_synchronous.clone();
-            let cache_size_opt = settings.sqlite_cache_size;
-            let busy_timeout_opt = settings.sqlite_busy_timeout;
-
-            let mut options = apply_common_settings_sqlite(SqlitePoolOptions::new(), &settings);
-
-            // Apply PRAGMA settings to each connection in the pool
-            options = options.after_connect(move |conn, _meta| {
-                let journal_mode = journal_mode_opt.clone();
-                let synchronous = synchronous_opt.clone();
-                let cache_size = cache_size_opt;
-                let busy_timeout = busy_timeout_opt;
-
-                Box::pin(async move {
-                    // journal_mode and synchronous are persistent (saved to DB file)
-                    if let Some(mode) = journal_mode {
-                        let pragma = format!("PRAGMA journal_mode = {mode}");
-                        sqlx::query(&pragma).execute(&mut *conn).await?;
-                    }
+            let read_connections = sqlite_read_connections(url, &settings);
 
-                    if let Some(sync) = synchronous {
-                        let pragma = format!("PRAGMA synchronous = {sync}");
-                        sqlx::query(&pragma).execute(&mut *conn).await?;
-                    }
+            let writer = build_sqlite_pool(url, &settings, read_connections.is_some()).await?;
+            info!("SQLite pool created with PRAGMA settings (create_if_missing=true)");
 
-                    // cache_size and busy_timeout are per-connection (must be set for each connection)
-                    if let Some(size) = cache_size {
-                        let pragma = format!("PRAGMA cache_size = {size}");
-                        sqlx::query(&pragma).execute(&mut *conn).await?;
+            // The writer pool has already created the database and switched it
+            // to WAL, so readers can open it read-only
+            let reader = match read_connections {
+                Some(size) => match build_sqlite_read_pool(url, &settings, size).await {
+                    Ok(reader) => {
+                        info!("SQLite read pool created ({} connections)", size);
+                        Some(DbPool::Sqlite(reader))
                     }
-
-                    if let Some(timeout) = busy_timeout {
-                        let pragma = format!("PRAGMA busy_timeout = {timeout}");
-                        sqlx::query(&pragma).execute(&mut *conn).await?;
+                    Err(err) => {
+                        writer.close().await;
+                        return Err(err);
                     }
+                },
+                None => None,
+            };
 
-                    Ok(())
-                })
-            });
-
-            // Parse URL and enable automatic database file creation
-            let connect_opts = SqliteConnectOptions::from_str(url)
-                .map_err(|e| DriverError::ConnectionError(format!("Invalid SQLite URL: {e}")))?
-                .create_if_missing(true);
-
-            let pool = options
-                .connect_with(connect_opts)
-                .await
-                .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))?;
-
-            info!("SQLite pool created with PRAGMA settings (create_if_missing=true)");
-
-            DbPool::Sqlite(pool)
+            (DbPool::Sqlite(writer), reader)
         }
     };
 
-    let handle = PoolHandle::new(backend, pool);
+    let mut handle = PoolHandle::new(backend, pool);
+    if let Some(read_pool) = read_pool {
+        handle = handle.with_read_pool(read_pool);
+    }
 
     if overwrite {
         // Close old pool if exists
@@ -178,6 +150,113 @@ pub async fn pool_backend(name: &str) -> Result<DatabaseBackend> {
     registry().get(name).await.map(|handle| handle.backend)
 }
 
+/// Number of read-only connections to open next to the SQLite writer pool.
+///
+/// A separate read pool only makes sense for file databases in WAL mode:
+/// in-memory databases are private to each connection (or shared-cache,
+/// which serializes anyway), and rollback journals block readers during writes.
+fn sqlite_read_connections(url: &str, settings: &PoolSettings) -> Option<u32> {
+    let size = settings.sqlite_read_connections.filter(|size| *size > 0)?;
+    let is_wal = settings
+        .sqlite_journal_mode
+        .as_deref()
+        .is_some_and(|mode| mode.eq_ignore_ascii_case("wal"));
+    let is_memory = url.contains(":memory:") || url.contains("mode=memory");
+    (is_wal && !is_memory).then_some(size)
+}
+
+/// Attach the PRAGMA script to every connection the pool opens.
+fn with_sqlite_pragmas(options: SqlitePoolOptions, script: Option<String>) -> SqlitePoolOptions {
+    let Some(script) = script else {
+        return options;
+    };
+    // Applied in a single round trip (journal_mode/synchronous are persistent,
+    // the rest are per-connection and must be set for each one)
+    options.after_connect(move |conn, _meta| {
+        let script = script.clone();
+        Box::pin(async move {
+            sqlx::raw_sql(&script).execute(&mut *conn).await?;
+            Ok(())
+        })
+    })
+}
+
+/// Build the primary SQLite pool. With a read pool alongside it, this pool
+/// is the single writer: one connection, so writers queue in the pool instead
+/// of spinning on `SQLITE_BUSY`.
+async fn build_sqlite_pool(
+    url: &str,
+    settings: &PoolSettings,
+    single_writer: bool,
+) -> Result<SqlitePool> {
+    let mut options = apply_common_settings_sqlite(SqlitePoolOptions::new(), settings);
+    if single_writer {
+        options = options.max_connections(1).min_connections(1);
+    }
+    let options = with_sqlite_pragmas(options, sqlite_pragma_script(settings, false));
+
+    // Parse URL and enable automatic database file creation
+    let connect_opts = build_sqlite_connect_options(url, settings)?.create_if_missing(true);
+
+    options
+        .connect_with(connect_opts)
+        .await
+        .map_err(|e| DriverError::ConnectionError(format!("Failed to connect: {e}")))
+}
+
+/// Build the read-only SQLite pool used for SELECTs outside transactions.
+async fn build_sqlite_read_pool(
+    url: &str,
+    settings: &PoolSettings,
+    size: u32,
+) -> Result<SqlitePool> {
+    let mut options = apply_common_settings_sqlite(SqlitePoolOptions::new(), settings)
+        .max_connections(size);
+    if let Some(min) = settings.min_connections {
+        options = options.min_connections(min.min(size));
+    }
+    let options = with_sqlite_pragmas(options, sqlite_pragma_script(settings, true));
+
+    let connect_opts = build_sqlite_connect_options(url, settings)?.read_only(true);
+
+    options
+        .connect_with(connect_opts)
+        .await
+        .map_err(|e| DriverError::ConnectionError(format!("Failed to connect read pool: {e}")))
+}
+
+/// Build the `PRAGMA` script applied to every new SQLite connection.
+///
+/// Read-only connections skip `journal_mode`/`synchronous`: they cannot
+/// change the journal mode and never write.
+///
+/// Returns `None` when no PRAGMA is configured.
+fn sqlite_pragma_script(settings: &PoolSettings, read_only: bool) -> Option<String> {
+    let mut pragmas: Vec<String> = Vec::new();
+    if !read_only {
+        if let Some(mode) = &settings.sqlite_journal_mode {
+            pragmas.push(format!("PRAGMA journal_mode = {mode};"));
+        }
+        if let Some(sync) = &settings.sqlite_synchronous {
+            pragmas.push(format!("PRAGMA synchronous = {sync};"));
+        }
+    }
+    if let Some(size) = settings.sqlite_cache_size {
+        pragmas.push(format!("PRAGMA cache_size = {size};"));
+    }
+    if let Some(timeout) = settings.sqlite_busy_timeout {
+        pragmas.push(format!("PRAGMA busy_timeout = {timeout};"));
+    }
+    if let Some(store) = &settings.sqlite_temp_store {
+        pragmas.push(format!("PRAGMA temp_store = {store};"));
+    }
+    if pragmas.is_empty() {
+        None
+    } else {
+        Some(pragmas.join("\n"))
+    }
+}
+
 fn backend_from_url(url: &str) -> Option<DatabaseBackend> {
     if url.starts_with("postgres") {
         Some(DatabaseBackend::Postgres)
@@ -262,12 +341,11 @@ fn apply_common_settings_sqlite(
     if let Some(timeout) = settings.acquire_timeout {
         options = options.acquire_timeout(timeout);
     }
-    if let Some(timeout) = settings.idle_timeout {
-        options = options.idle_timeout(timeout);
-    }
-    if let Some(lifetime) = settings.max_lifetime {
-        options = options.max_lifetime(lifetime);
-    }
+    // SQLite connections are local file handles: keep them for the lifetime of
+    // the pool unless told otherwise, instead of reopening the file (and its
+    // WAL/SHM files, and replaying PRAGMAs) on sqlx's default idle/lifetime expiry
+    options = options.idle_timeout(settings.idle_timeout);
+    options = options.max_lifetime(settings.max_lifetime);
     if let Some(test_before) = settings.test_before_acquire {
         options = options.test_before_acquire(test_before);
     }
@@ -300,6 +378,19 @@ fn build_pg_connect_options(url: &str, settings: &PoolSettings) -> Result<PgConn
     Ok(opts)
 }
 
+fn build_sqlite_connect_options(url: &str, settings: &PoolSettings) -> Result<SqliteConnectOptions> {
+    let mut opts = SqliteConnectOptions::from_str(url)
+        .map_err(|e| DriverError::ConnectionError(format!("Invalid SQLite URL: {e}")))?;
+
+    // Prepared statements are cached per connection, keyed by SQL text.
+    // SQLite re-prepares them itself after schema changes.
+    if let Some(cap) = settings.sqlite_statement_cache_capacity {
+        opts = opts.statement_cache_capacity(cap as usize);
+    }
+
+    Ok(opts)
+}
+
 fn build_mysql_connect_options(url: &str, settings: &PoolSettings) -> Result<MySqlConnectOptions> {
     let mut opts = MySqlConnectOptions::from_str(url)
         .map_err(|e| DriverError::ConnectionError(format!("Invalid MySQL URL: {e}")))?;
@@ -18,27 +18,83 @@ pub enum DbPool {
     Sqlite(SqlitePool),
 }
 
+impl DbPool {
+    async fn close(&self) {
+        match self {
+            DbPool::Postgres(pool) => pool.close().await,
+            DbPool::MySql(pool) => pool.close().await,
+            DbPool::Sqlite(pool) => pool.close().await,
+        }
+    }
+}
+
 /// Named pool handle: backend type + connection pool.
+///
+/// SQLite pools in WAL mode may carry a second, read-only pool. Plain
+/// SELECTs executed outside a transaction are routed to it, everything
+/// else (DML, DDL, transactions) goes through the primary (writer) pool.
 #[derive(Clone)]
 pub struct PoolHandle {
     pub(crate) backend: DatabaseBackend,
     pub(crate) pool: DbPool,
+    pub(crate) read_pool: Option<DbPool>,
 }
 
 impl PoolHandle {
     pub fn new(backend: DatabaseBackend, pool: DbPool) -> Self {
-        Self { backend, pool }
+        Self {
+            backend,
+            pool,
+            read_pool: None,
+        }
+    }
+
+    pub fn with_read_pool(mut self, read_pool: DbPool) -> Self {
+        self.read_pool = Some(read_pool);
+        self
     }
 
     pub async fn close(&self) {
-        match &self.pool {
-            DbPool::Postgres(pool) => pool.close().await,
-            DbPool::MySql(pool) => pool.close().await,
-            DbPool::Sqlite(pool) => pool.close().await,
+        if let Some(read_pool) = &self.read_pool {
+            read_pool.close().await;
         }
+        self.pool.close().await;
     }
 
     pub fn clone_pool(&self) -> DbPool {
         self.pool.clone()
     }
+
+    /// Pool to run `sql` on: the read-only pool for plain SELECTs when one
+    /// is configured, the primary pool otherwise.
+    pub fn clone_pool_for(&self, sql: &str) -> DbPool {
+        match &self.read_pool {
+            Some(read_pool) if is_read_only_sql(sql) => read_pool.clone(),
+            _ => self.pool.clone(),
+        }
+    }
+}
+
+/// Whether `sql` is a plain SELECT that is safe to run on a read-only connection.
+///
+/// `WITH` is deliberately not matched: a CTE may wrap INSERT/UPDATE/DELETE.
+fn is_read_only_sql(sql: &str) -> bool {
+    sql.trim_start()
+        .get(..6)
+        .is_some_and(|head| head.eq_ignore_ascii_case("select"))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::is_read_only_sql;
+
+    #[test]
+    fn test_is_read_only_sql() {
+        assert!(is_read_only_sql("SELECT 1"));
+        assert!(is_read_only_sql("  select * from t"));
+        assert!(!is_read_only_sql("INSERT INTO t VALUES (1)"));
+        assert!(!is_read_only_sql("WITH x AS (SELECT 1) DELETE FROM t"));
+        assert!(!is_read_only_sql("SEL"));
+        assert!(!is_read_only_sql(""));
+    }
 }
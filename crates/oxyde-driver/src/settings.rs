@@ -18,6 +18,9 @@ pub struct PoolSettings {
     pub sqlite_synchronous: Option<String>,
     pub sqlite_cache_size: Option<i32>,
     pub sqlite_busy_timeout: Option<i32>,
+    pub sqlite_temp_store: Option<String>,
+    pub sqlite_read_connections: Option<u32>, // Dedicated read-only pool size (WAL only)
+    pub sqlite_statement_cache_capacity: Option<u32>,
     // TLS settings (PostgreSQL + MySQL)
     pub ssl_mode: Option<String>,
     pub ssl_root_cert: Option<String>,
@@ -46,6 +49,9 @@ impl Default for PoolSettings {
             sqlite_synchronous: None,
             sqlite_cache_size: None,
             sqlite_busy_timeout: None,
+            sqlite_temp_store: None,
+            sqlite_read_connections: None,
+            sqlite_statement_cache_capacity: None,
             ssl_mode: None,
             ssl_root_cert: None,
             ssl_client_cert: None,
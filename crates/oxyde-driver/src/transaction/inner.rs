@@ -46,12 +46,19 @@ impl DbTx {
 }
 
 /// Begin a transaction on a pooled connection (sqlx emits the dialect's BEGIN).
+///
+/// SQLite transactions start with `BEGIN IMMEDIATE`: the write lock is taken
+/// up front, so a transaction that reads before it writes waits on
+/// `busy_timeout` instead of failing with `SQLITE_BUSY` when another
+/// connection is already writing.
 pub(crate) async fn begin_on_pool(pool: &DbPool) -> Result<DbTx> {
     let begin_err = |e: sqlx::Error| DriverError::db("BEGIN failed", e);
     match pool {
         DbPool::Postgres(p) => Ok(DbTx::Postgres(p.begin().await.map_err(begin_err)?)),
         DbPool::MySql(p) => Ok(DbTx::MySql(p.begin().await.map_err(begin_err)?)),
-        DbPool::Sqlite(p) => Ok(DbTx::Sqlite(p.begin().await.map_err(begin_err)?)),
+        DbPool::Sqlite(p) => Ok(DbTx::Sqlite(
+            p.begin_with("BEGIN IMMEDIATE").await.map_err(begin_err)?,
+        )),
     }
 }
 
@@ -31,6 +31,30 @@ fn make_col_expr(col_name: &str, default_table: Option<&str>) -> Expr {
     }
 }
 
+/// Longest IN list whose placeholder count is rounded up (see [`pad_in_list`]).
+const IN_LIST_PAD_LIMIT: usize = 64;
+
+/// Iterate over IN-list values, repeating the last one so that the number of
+/// placeholders is the next power of two.
+///
+/// `id IN (?, ?, ?)` and `id IN (?, ?, ?, ?)` are distinct statements for the
+/// driver's prepared statement cache; bucketing arities lets lists of varying
+/// length share a handful of statements. Repeating an existing value (rather
+/// than padding with NULL) keeps `NOT IN` semantics intact.
+fn pad_in_list(values: &[rmpv::Value]) -> impl Iterator<Item = &rmpv::Value> {
+    let len = values.len();
+    let padded = if (2..=IN_LIST_PAD_LIMIT).contains(&len) {
+        len.next_power_of_two()
+    } else {
+        len
+    };
+    let padding = values
+        .last()
+        .into_iter()
+        .flat_map(move |last| std::iter::repeat(last).take(padded - len));
+    values.iter().chain(padding)
+}
+
 /// Resolve column type hint from col_types map.
 /// Handles qualified names like "user.age" by extracting the column part.
 fn resolve_col_spec<'a>(
@@ -173,8 +197,7 @@ fn apply_filter(
         }
         "IN" => {
             if let rmpv::Value::Array(arr) = &filter.value {
-                let values: Vec<SimpleExpr> = arr
-                    .iter()
+                let values: Vec<SimpleExpr> = pad_in_list(arr)
                     .map(|v| typed_value_expr(bind_value(v, spec), spec, dialect))
                     .collect();
                 col.is_in(values)
@@ -248,6 +248,29 @@ mod tests {
         assert_eq!(params.len(), 2);
     }
 
+    #[test]
+    fn test_filter_in_list_is_padded_to_power_of_two() {
+        let in_filter = |n: i64| QueryIR {
+            table: "posts".into(),
+            cols: Some(vec!["id".into()]),
+            filter_tree: Some(filter_cond(
+                "id",
+                "IN",
+                rmpv_arr((1..=n).map(rmpv_int).collect()),
+            )),
+            ..Default::default()
+        };
+        let (sql3, params3) = build_sql(&in_filter(3), Dialect::Sqlite).unwrap();
+        let (sql4, params4) = build_sql(&in_filter(4), Dialect::Sqlite).unwrap();
+        assert_eq!(sql3, sql4);
+        assert_eq!(params3.len(), 4);
+        assert_eq!(params3[3], params3[2]);
+        assert_eq!(params4.len(), 4);
+
+        let (_, params1) = build_sql(&in_filter(1), Dialect::Sqlite).unwrap();
+        assert_eq!(params1.len(), 1);
+    }
+
     #[test]
     fn test_qualified_filter_enum_value_is_cast_on_postgres() {
         let ir = QueryIR {
@@ -31,6 +31,7 @@ from oxyde import (
     Avg,
     Max,
     Min,
+    atomic,
     disconnect_all,
     execute_raw,
 )
@@ -76,68 +77,68 @@ class Order(Model):
 
 async def setup_tables(db: AsyncDatabase) -> None:
     """Create tables using raw SQL."""
-    await execute_raw(
-        """
-        CREATE TABLE IF NOT EXISTS products (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            category TEXT NOT NULL,
-            price INTEGER NOT NULL,
-            stock INTEGER DEFAULT 0,
-            is_active INTEGER DEFAULT 1
+    # One transaction for the whole schema: a single commit instead of
+    # one per CREATE TABLE
+    async with atomic(using=db.name):
+        await execute_raw(
+            """
+            CREATE TABLE IF NOT EXISTS products (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                category TEXT NOT NULL,
+                price INTEGER NOT NULL,
+                stock INTEGER DEFAULT 0,
+                is_active INTEGER DEFAULT 1
+            )
+        """,
+            using=db.name,
         )
-    """,
-        using=db.name,
-    )
-    await execute_raw(
-        """
-        CREATE TABLE IF NOT EXISTS orders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            product_id INTEGER NOT NULL REFERENCES products(id),
-            quantity INTEGER NOT NULL,
-            total INTEGER NOT NULL
+        await execute_raw(
+            """
+            CREATE TABLE IF NOT EXISTS orders (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                product_id INTEGER NOT NULL REFERENCES products(id),
+                quantity INTEGER NOT NULL,
+                total INTEGER NOT NULL
+            )
+        """,
+            using=db.name,
         )
-    """,
-        using=db.name,
-    )
 
 
 async def seed_data(db: AsyncDatabase) -> None:
     """Insert sample data."""
-    # Clear existing data
-    await Order.objects.filter().delete(using=db.name)
-    await Product.objects.filter().delete(using=db.name)
-
-    # Create products
-    products = await Product.objects.bulk_create(
-        [
-            {"name": "Laptop", "category": "Electronics", "price": 99900, "stock": 10},
-            {"name": "Mouse", "category": "Electronics", "price": 2500, "stock": 50},
-            {"name": "Keyboard", "category": "Electronics", "price": 7500, "stock": 30},
-            {"name": "Desk", "category": "Furniture", "price": 29900, "stock": 5},
-            {"name": "Chair", "category": "Furniture", "price": 19900, "stock": 8},
-            {
-                "name": "Monitor",
-                "category": "Electronics",
-                "price": 34900,
-                "stock": 0,
-                "is_active": False,
-            },
-        ],
-        using=db.name,
-    )
-
-    # Create orders
-    await Order.objects.bulk_create(
-        [
-            {"product_id": products[0].id, "quantity": 2, "total": 199800},
-            {"product_id": products[1].id, "quantity": 5, "total": 12500},
-            {"product_id": products[1].id, "quantity": 3, "total": 7500},
-            {"product_id": products[2].id, "quantity": 1, "total": 7500},
-            {"product_id": products[3].id, "quantity": 1, "total": 29900},
-        ],
-        using=db.name,
-    )
+    product_rows = [
+        {"name": "Laptop", "category": "Electronics", "price": 99900, "stock": 10},
+        {"name": "Mouse", "category": "Electronics", "price": 2500, "stock": 50},
+        {"name": "Keyboard", "category": "Electronics", "price": 7500, "stock": 30},
+        {"name": "Desk", "category": "Furniture", "price": 29900, "stock": 5},
+        {"name": "Chair", "category": "Furniture", "price": 19900, "stock": 8},
+        {
+            "name": "Monitor",
+            "category": "Electronics",
+            "price": 34900,
+            "stock": 0,
+            "is_active": False,
+        },
+    ]
+
+    # Clear and reseed in one transaction: one commit for the whole burst
+    async with atomic(using=db.name):
+        await Order.objects.filter().delete(using=db.name)
+        await Product.objects.filter().delete(using=db.name)
+
+        products = await Product.objects.bulk_create(product_rows, using=db.name)
+        await Order.objects.bulk_create(
+            [
+                {"product_id": products[0].id, "quantity": 2, "total": 199800},
+                {"product_id": products[1].id, "quantity": 5, "total": 12500},
+                {"product_id": products[1].id, "quantity": 3, "total": 7500},
+                {"product_id": products[2].id, "quantity": 1, "total": 7500},
+                {"product_id": products[3].id, "quantity": 1, "total": 29900},
+            ],
+            using=db.name,
+        )
 
     print(f"Seeded {len(products)} products and 5 orders")
 
@@ -165,23 +166,34 @@ async def main() -> None:
         # ---------------------------------------------------------------------
         print("\n1. Q Expressions (AND, OR, NOT)...")
 
+        # The demos below only print names, so they fetch just that column
+        # with values_list(..., flat=True) instead of hydrating full models.
+
         # OR condition: Electronics OR price < 200
-        results = await Product.objects.filter(
-            Q(category="Electronics") | Q(price__lt=20000)
-        ).all(using=db.name)
-        print(f"   Electronics OR cheap: {[p.name for p in results]}")
+        names = (
+            await Product.objects.filter(Q(category="Electronics") | Q(price__lt=20000))
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   Electronics OR cheap: {names}")
 
         # AND with OR: Active AND (Electronics OR Furniture with stock > 5)
-        results = await Product.objects.filter(
-            Q(is_active=True) & (Q(category="Electronics") | Q(stock__gt=5))
-        ).all(using=db.name)
-        print(f"   Complex filter: {[p.name for p in results]}")
+        names = (
+            await Product.objects.filter(
+                Q(is_active=True) & (Q(category="Electronics") | Q(stock__gt=5))
+            )
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   Complex filter: {names}")
 
         # NOT: Products not in Electronics
-        results = await Product.objects.filter(~Q(category="Electronics")).all(
-            using=db.name
+        names = (
+            await Product.objects.filter(~Q(category="Electronics"))
+            .values_list("name", flat=True)
+            .all(using=db.name)
         )
-        print(f"   NOT Electronics: {[p.name for p in results]}")
+        print(f"   NOT Electronics: {names}")
 
         # ---------------------------------------------------------------------
         # EXCLUDE - Negation
@@ -189,15 +201,20 @@ async def main() -> None:
         print("\n2. exclude() - Negation...")
 
         # All except inactive
-        results = await Product.objects.exclude(is_active=False).all(using=db.name)
-        print(f"   Exclude inactive: {[p.name for p in results]}")
+        names = (
+            await Product.objects.exclude(is_active=False)
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   Exclude inactive: {names}")
 
         # Exclude multiple conditions
-        results = await Product.objects.exclude(
-            category="Electronics",
-            stock__lt=10,
-        ).all(using=db.name)
-        print(f"   Exclude Electronics with low stock: {[p.name for p in results]}")
+        names = (
+            await Product.objects.exclude(category="Electronics", stock__lt=10)
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   Exclude Electronics with low stock: {names}")
 
         # ---------------------------------------------------------------------
         # LOOKUPS - Field Operators
@@ -205,20 +222,28 @@ async def main() -> None:
         print("\n3. Lookups (operators)...")
 
         # Range
-        results = await Product.objects.filter(price__gte=5000, price__lte=30000).all(
-            using=db.name
+        names = (
+            await Product.objects.filter(price__gte=5000, price__lte=30000)
+            .values_list("name", flat=True)
+            .all(using=db.name)
         )
-        print(f"   Price $50-$300: {[p.name for p in results]}")
+        print(f"   Price $50-$300: {names}")
 
         # Contains (case-insensitive)
-        results = await Product.objects.filter(name__icontains="o").all(using=db.name)
-        print(f"   Name contains 'o': {[p.name for p in results]}")
+        names = (
+            await Product.objects.filter(name__icontains="o")
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   Name contains 'o': {names}")
 
         # In list
-        results = await Product.objects.filter(
-            category__in=["Electronics", "Furniture"]
-        ).all(using=db.name)
-        print(f"   In categories: {[p.name for p in results]}")
+        names = (
+            await Product.objects.filter(category__in=["Electronics", "Furniture"])
+            .values_list("name", flat=True)
+            .all(using=db.name)
+        )
+        print(f"   In categories: {names}")
 
         # ---------------------------------------------------------------------
         # AGGREGATES
@@ -280,10 +305,12 @@ async def main() -> None:
         print(f"   Incremented stock for {updated} Electronics products")
 
         # Check updated values
-        electronics = await Product.objects.filter(category="Electronics").all(
-            using=db.name
+        stock_levels = (
+            await Product.objects.filter(category="Electronics")
+            .values_list("name", "stock")
+            .all(using=db.name)
         )
-        print(f"   New stock levels: {[(p.name, p.stock) for p in electronics]}")
+        print(f"   New stock levels: {stock_levels}")
 
         # ---------------------------------------------------------------------
         # ORDER BY, DISTINCT, LIMIT, OFFSET
@@ -292,23 +319,30 @@ async def main() -> None:
 
         # Order by price descending
         expensive_first = (
-            await Product.objects.order_by("-price").limit(3).all(using=db.name)
+            await Product.objects.order_by("-price")
+            .limit(3)
+            .values_list("name", flat=True)
+            .all(using=db.name)
         )
-        print(f"   Top 3 expensive: {[p.name for p in expensive_first]}")
+        print(f"   Top 3 expensive: {expensive_first}")
 
         # Order by multiple fields
-        sorted_products = await Product.objects.order_by("category", "-price").all(
-            using=db.name
-        )
-        print(
-            f"   By category, then price: {[(p.category, p.name) for p in sorted_products]}"
+        sorted_products = (
+            await Product.objects.order_by("category", "-price")
+            .values_list("category", "name")
+            .all(using=db.name)
         )
+        print(f"   By category, then price: {sorted_products}")
 
         # Pagination with offset
         page2 = (
-            await Product.objects.order_by("id").offset(2).limit(2).all(using=db.name)
+            await Product.objects.order_by("id")
+            .offset(2)
+            .limit(2)
+            .values_list("name", flat=True)
+            .all(using=db.name)
         )
-        print(f"   Page 2 (2 items): {[p.name for p in page2]}")
+        print(f"   Page 2 (2 items): {page2}")
 
         # Distinct categories
         categories = (
@@ -325,7 +359,8 @@ async def main() -> None:
 
         # Count products per category
         by_category = (
-            await Product.objects.annotate(product_count=Count("id"))
+            await Product.objects.values("category")
+            .annotate(product_count=Count("id"))
             .group_by("category")
             .all(using=db.name)
         )
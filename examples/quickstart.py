@@ -16,7 +16,7 @@ from __future__ import annotations
 import asyncio
 import os
 
-from oxyde import AsyncDatabase, Model, Field, disconnect_all, execute_raw
+from oxyde import AsyncDatabase, Model, Field, atomic, disconnect_all, execute_raw
 
 
 # =============================================================================
@@ -70,46 +70,50 @@ class Comment(Model):
 
 async def setup_tables(db: AsyncDatabase) -> None:
     """Create tables using raw SQL (in real apps, use migrations)."""
-    await execute_raw(
-        """
-        CREATE TABLE IF NOT EXISTS authors (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            email TEXT NOT NULL UNIQUE
+    # One transaction for the whole schema: a single commit instead of
+    # one per CREATE TABLE
+    async with atomic(using=db.name):
+        await execute_raw(
+            """
+            CREATE TABLE IF NOT EXISTS authors (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                email TEXT NOT NULL UNIQUE
+            )
+        """,
+            using=db.name,
         )
-    """,
-        using=db.name,
-    )
-    await execute_raw(
-        """
-        CREATE TABLE IF NOT EXISTS posts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT DEFAULT '',
-            views INTEGER DEFAULT 0,
-            author_id INTEGER REFERENCES authors(id) ON DELETE CASCADE
+        await execute_raw(
+            """
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT DEFAULT '',
+                views INTEGER DEFAULT 0,
+                author_id INTEGER REFERENCES authors(id) ON DELETE CASCADE
+            )
+        """,
+            using=db.name,
         )
-    """,
-        using=db.name,
-    )
-    await execute_raw(
-        """
-        CREATE TABLE IF NOT EXISTS comments (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
-            body TEXT NOT NULL,
-            likes INTEGER DEFAULT 0
+        await execute_raw(
+            """
+            CREATE TABLE IF NOT EXISTS comments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                post_id INTEGER NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+                body TEXT NOT NULL,
+                likes INTEGER DEFAULT 0
+            )
+        """,
+            using=db.name,
         )
-    """,
-        using=db.name,
-    )
 
 
 async def cleanup(db: AsyncDatabase) -> None:
-    """Clean up test data."""
-    await Comment.objects.filter().delete(using=db.name)
-    await Post.objects.filter().delete(using=db.name)
-    await Author.objects.filter().delete(using=db.name)
+    """Clean up test data in a single transaction."""
+    async with atomic(using=db.name):
+        await Comment.objects.filter().delete(using=db.name)
+        await Post.objects.filter().delete(using=db.name)
+        await Author.objects.filter().delete(using=db.name)
 
 
 # =============================================================================
@@ -59,24 +59,29 @@ async def setup_tables(db: AsyncDatabase) -> None:
 
 async def seed_data(db: AsyncDatabase) -> list[Account]:
     """Insert sample accounts."""
-    await Account.objects.filter().delete(using=db.name)
-
-    accounts = await Account.objects.bulk_create(
-        [
-            {"owner": "Alice", "balance": 100000},  # $1000
-            {"owner": "Bob", "balance": 50000},  # $500
-            {"owner": "Charlie", "balance": 25000},  # $250
-        ],
-        using=db.name,
-    )
+    async with atomic(using=db.name):
+        await Account.objects.filter().delete(using=db.name)
+
+        accounts = await Account.objects.bulk_create(
+            [
+                {"owner": "Alice", "balance": 100000},  # $1000
+                {"owner": "Bob", "balance": 50000},  # $500
+                {"owner": "Charlie", "balance": 25000},  # $250
+            ],
+            using=db.name,
+        )
     return accounts
 
 
 async def print_balances(db: AsyncDatabase) -> None:
     """Print current account balances."""
-    accounts = await Account.objects.order_by("owner").all(using=db.name)
-    for acc in accounts:
-        print(f"      {acc.owner}: ${acc.balance / 100:.2f}")
+    balances = (
+        await Account.objects.order_by("owner")
+        .values_list("owner", "balance")
+        .all(using=db.name)
+    )
+    for owner, balance in balances:
+        print(f"      {owner}: ${balance / 100:.2f}")
 
 
 # =============================================================================
@@ -118,12 +123,12 @@ async def demo_successful_transaction(
     async with atomic(using=db.name) as tx:
         # Debit Alice
         await Account.objects.filter(id=accounts[0].id).update(
-            balance=accounts[0].balance - 10000,
+            balance=F("balance") - 10000,
             client=tx,
         )
         # Credit Bob
         await Account.objects.filter(id=accounts[1].id).update(
-            balance=accounts[1].balance + 10000,
+            balance=F("balance") + 10000,
             client=tx,
         )
     # Transaction commits automatically when exiting context
@@ -142,7 +147,7 @@ async def demo_failed_transaction(db: AsyncDatabase, accounts: list[Account]) ->
         async with atomic(using=db.name) as tx:
             # Debit Bob
             await Account.objects.filter(id=accounts[1].id).update(
-                balance=accounts[1].balance - 5000,
+                balance=F("balance") - 5000,
                 client=tx,
             )
 
@@ -151,7 +156,7 @@ async def demo_failed_transaction(db: AsyncDatabase, accounts: list[Account]) ->
 
             # This never executes
             await Account.objects.filter(id=accounts[2].id).update(
-                balance=accounts[2].balance + 5000,
+                balance=F("balance") + 5000,
                 client=tx,
             )
 
@@ -171,7 +176,7 @@ async def demo_nested_transactions(db: AsyncDatabase, accounts: list[Account]) -
     async with atomic(using=db.name) as outer_tx:
         # First operation in outer transaction
         await Account.objects.filter(id=accounts[0].id).update(
-            balance=accounts[0].balance - 2000,  # -$20 from Alice
+            balance=F("balance") - 2000,  # -$20 from Alice
             client=outer_tx,
         )
         print("   Outer: Alice debited $20")
@@ -180,7 +185,7 @@ async def demo_nested_transactions(db: AsyncDatabase, accounts: list[Account]) -
             async with atomic(using=db.name) as inner_tx:
                 # This will be in a savepoint
                 await Account.objects.filter(id=accounts[2].id).update(
-                    balance=accounts[2].balance + 2000,  # +$20 to Charlie
+                    balance=F("balance") + 2000,  # +$20 to Charlie
                     client=inner_tx,
                 )
                 print("   Inner: Charlie credited $20")
@@ -194,7 +199,7 @@ async def demo_nested_transactions(db: AsyncDatabase, accounts: list[Account]) -
         # Outer transaction can still continue and commit
         # But Charlie's credit is rolled back
         await Account.objects.filter(id=accounts[1].id).update(
-            balance=accounts[1].balance + 2000,  # +$20 to Bob instead
+            balance=F("balance") + 2000,  # +$20 to Bob instead
             client=outer_tx,
         )
         print("   Outer: Bob credited $20 instead")
@@ -224,18 +229,15 @@ async def main() -> None:
         print("\nInitial balances:")
         await print_balances(db)
 
+        # The demos update balances with F() expressions, so they only need
+        # the account ids and never re-read balances into Python.
+
         # Demo 1: Successful transaction
         await demo_successful_transaction(db, accounts)
 
-        # Refresh account data
-        accounts = list(await Account.objects.order_by("id").all(using=db.name))
-
         # Demo 2: Failed transaction with rollback
         await demo_failed_transaction(db, accounts)
 
-        # Refresh account data
-        accounts = list(await Account.objects.order_by("id").all(using=db.name))
-
         # Demo 3: Nested transactions
         await demo_nested_transactions(db, accounts)
 
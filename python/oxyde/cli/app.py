@@ -11,6 +11,9 @@ app = typer.Typer(
     name="oxyde",
     help="Oxyde ORM - Database migration and management tool",
     no_args_is_help=True,
+    # Plain click help: rendering through rich imports rich.console,
+    # rich.markdown and rich.traceback (~100 ms) on every --help.
+    rich_markup_mode=None,
 )
 
 
@@ -15,7 +15,7 @@ def generate_stubs() -> None:
     methods with all field lookups (contains, gt, gte, etc.).
     """
     from oxyde.codegen import generate_stubs_for_models, write_stubs
-    from oxyde.models.registry import registered_tables
+    from oxyde.models.registry import iter_tables
 
     # Load config and import models
     config = load_config_or_exit()
@@ -31,7 +31,7 @@ def generate_stubs() -> None:
 
     try:
         # Get all registered table models
-        models = list(registered_tables().values())
+        models = list(iter_tables())
 
         if not models:
             typer.secho("⚠️  No table models found", fg=typer.colors.YELLOW)
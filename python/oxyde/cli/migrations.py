@@ -35,6 +35,7 @@ def makemigrations(
         generate_migration_file,
         replay_migrations,
     )
+    from oxyde.migrations.utils import list_migration_files
 
     # Load config
     config = load_config_or_exit()
@@ -76,7 +77,7 @@ def makemigrations(
     else:
         try:
             old_schema = replay_migrations(config.migrations_dir)
-            migration_count = len(list(migrations_path.glob("[0-9]*.py")))
+            migration_count = len(list_migration_files(migrations_path))
             typer.echo(f"   ✅ Replayed {migration_count} migration(s)")
         except Exception as e:
             typer.secho(f"   ❌ Error replaying migrations: {e}", fg=typer.colors.RED)
@@ -154,9 +155,9 @@ def makemigrations(
         typer.echo("5️⃣  Generating type stubs...")
         try:
             from oxyde.codegen import generate_stubs_for_models, write_stubs
-            from oxyde.models.registry import registered_tables
+            from oxyde.models.registry import iter_tables
 
-            models = list(registered_tables().values())
+            models = list(iter_tables())
             if models:
                 stub_mapping = generate_stubs_for_models(models)
                 write_stubs(stub_mapping)
@@ -342,7 +343,7 @@ def showmigrations(
     """
     Show list of all migrations with their status (applied/pending).
     """
-    from oxyde.migrations import get_applied_migrations, get_migration_files
+    from oxyde.migrations import get_applied_migrations_among, get_migration_files
 
     # Load config
     config = load_config_or_exit()
@@ -351,19 +352,20 @@ def showmigrations(
     typer.echo("📋 Migrations status:")
     typer.echo()
 
-    async def run_show() -> set[str]:
+    async def run_show(all_migrations: list[Path]) -> set[str]:
         # Initialize database connection
         await init_databases({db_alias: config.databases[db_alias]})
 
-        # Get applied migrations
-        applied = await get_applied_migrations(db_alias)
+        # Get applied migrations among the files on disk
+        applied = await get_applied_migrations_among(
+            [migration_path.stem for migration_path in all_migrations], db_alias
+        )
         return set(applied)
 
     try:
-        applied_set = asyncio.run(run_show())
-
         # Get all migration files
         all_migrations = get_migration_files(config.migrations_dir)
+        applied_set = asyncio.run(run_show(all_migrations))
 
         if not all_migrations:
             typer.secho("No migrations found", fg=typer.colors.YELLOW)
@@ -461,7 +463,9 @@ def sqlmigrate(
 
 # ── oxyde migrations <subcommand> ────────────────────────────────────────
 
-migrations_app = typer.Typer(help="Migration maintenance commands")
+migrations_app = typer.Typer(
+    help="Migration maintenance commands", rich_markup_mode=None
+)
 app.add_typer(migrations_app, name="migrations")
 
 
@@ -484,10 +488,11 @@ def squash(
     record the new initial migration without executing it.
     """
     from oxyde.migrations.squash import squash_migrations
+    from oxyde.migrations.utils import list_migration_files
 
     config = load_config_or_exit()
     migrations_path = Path(config.migrations_dir)
-    files = sorted(migrations_path.glob("[0-9]*.py"))
+    files = list_migration_files(migrations_path)
 
     if not files:
         typer.secho(
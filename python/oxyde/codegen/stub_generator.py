@@ -8,44 +8,60 @@ import inspect
 import re
 import sys
 import types
+import weakref
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ForwardRef, Literal, Union, get_args, get_origin
 from uuid import UUID
 
 from oxyde.models.base import Model
 from oxyde.models.lookups import _allowed_lookups_for_meta, _resolve_column_meta
-from oxyde.models.registry import registered_tables
+from oxyde.models.registry import iter_tables
 
 
 def _get_python_type_name(python_type: Any) -> str:
-    """Get string representation of Python type for stub file."""
-    if python_type is str:
-        return "str"
-    elif python_type is int:
-        return "int"
-    elif python_type is float:
-        return "float"
-    elif python_type is bool:
-        return "bool"
-    elif python_type is bytes:
-        return "bytes"
-    elif python_type is datetime:
-        return "datetime"
-    elif python_type is date:
-        return "date"
-    elif python_type is time:
-        return "time"
-    elif python_type is Decimal:
-        return "Decimal"
-    elif python_type is UUID:
-        return "UUID"
-    elif python_type is type(None):
-        return "None"
-    elif python_type is Ellipsis:
-        return "..."
-    elif isinstance(python_type, ForwardRef):
+    """Get string representation of Python type for stub file.
+
+    Memoized: every field of every model goes through here, but a project
+    only uses a handful of distinct annotations.
+    """
+    try:
+        return _cached_python_type_name(python_type)
+    except TypeError:
+        # Unhashable annotation object: render it without the cache
+        return _render_python_type_name(python_type)
+
+
+# Types rendered by a fixed name, checked with one dict lookup before the
+# structural cases below
+_SIMPLE_TYPE_NAMES: dict[Any, str] = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    bytes: "bytes",
+    datetime: "datetime",
+    date: "date",
+    time: "time",
+    Decimal: "Decimal",
+    UUID: "UUID",
+    type(None): "None",
+    Ellipsis: "...",
+}
+
+
+def _render_python_type_name(python_type: Any) -> str:
+    try:
+        return _SIMPLE_TYPE_NAMES[python_type]
+    except (KeyError, TypeError):
+        # Not a simple type, or an unhashable annotation object
+        pass
+
+    if isinstance(python_type, ForwardRef):
         # Unresolved forward reference (e.g. reverse FK to a class defined
         # later in the module). Its target name is already stub-safe.
         return python_type.__forward_arg__
@@ -77,6 +93,9 @@ def _get_python_type_name(python_type: Any) -> str:
         return str(python_type).replace("typing.", "")
 
 
+_cached_python_type_name = lru_cache(maxsize=256)(_render_python_type_name)
+
+
 def _filter_field_specs(model_class: type[Model]) -> dict[str, tuple[str, list[str]]]:
     """Per-field filter value type and allowed lookups.
 
@@ -117,19 +136,34 @@ def _filter_field_specs(model_class: type[Model]) -> dict[str, tuple[str, list[s
     return specs
 
 
+# Per-model result of _get_field_info: several stub sections need it for the
+# same model. Keyed weakly so throwaway model classes (tests) can be
+# collected; the model_fields dict is stored alongside so a model_rebuild()
+# (which replaces it) invalidates the entry.
+_FIELD_INFO_CACHE: weakref.WeakKeyDictionary[
+    type[Model], tuple[dict[str, Any], dict[str, tuple[Any, bool]]]
+] = weakref.WeakKeyDictionary()
+
+
 def _get_field_info(model_class: type[Model]) -> dict[str, tuple[Any, bool]]:
     """
     Get field info from model_fields, returns dict of field_name -> (python_type, is_pk).
 
     Uses model_fields (Pydantic) as primary source, with _db_meta as fallback for PK info.
     Excludes virtual fields (reverse FK, m2m) that don't map to DB columns.
+    The result is cached per model class and must not be mutated.
     """
     from oxyde.models.field import OxydeFieldInfo
     from oxyde.models.utils import _unpack_annotated, _unwrap_optional
 
+    model_fields = model_class.model_fields
+    cached = _FIELD_INFO_CACHE.get(model_class)
+    if cached is not None and cached[0] is model_fields:
+        return cached[1]
+
     result = {}
 
-    for field_name, field_info in model_class.model_fields.items():
+    for field_name, field_info in model_fields.items():
         # Skip virtual fields (reverse FK, m2m) - they don't map to DB columns
         if isinstance(field_info, OxydeFieldInfo):
             if getattr(field_info, "db_reverse_fk", None) or getattr(
@@ -153,6 +187,7 @@ def _get_field_info(model_class: type[Model]) -> dict[str, tuple[Any, bool]]:
 
         result[field_name] = (python_type, is_pk)
 
+    _FIELD_INFO_CACHE[model_class] = (model_fields, result)
     return result
 
 
@@ -167,13 +202,28 @@ _RESERVED_FILTER_PARAMS = frozenset(
 _RESERVED_CREATE_PARAMS = frozenset({"self", "instance", "client", "using"})
 
 
+# Value type of a lookup parameter where it differs from ``<field type> | None``
+# ({t} is the field type), matching what the runtime accepts: `in` takes any
+# iterable, between/range/month/day take a pair or triple as tuple or list,
+# year takes a bare int.
+_LOOKUP_VALUE_TYPES: dict[str, str] = {
+    "in": "Iterable[{t}] | None",
+    "between": "tuple[{t}, {t}] | list[{t}] | None",
+    "range": "tuple[{t}, {t}] | list[{t}] | None",
+    "isnull": "bool | None",
+    "year": "int | None",
+    "month": "tuple[int, int] | list[int] | None",
+    "day": "tuple[int, int, int] | list[int] | None",
+}
+
+
 def _generate_filter_params(model_class: type[Model]) -> str:
     """Generate filter method parameters with all lookups.
 
     Ends with ``**kwargs: Any`` because the runtime also accepts FK traversal
     paths (``author__name="Alice"``) that cannot be enumerated statically.
     """
-    lines = []
+    blocks = []
 
     for field_name, (type_name, lookups) in sorted(
         _filter_field_specs(model_class).items()
@@ -181,86 +231,60 @@ def _generate_filter_params(model_class: type[Model]) -> str:
         if field_name in _RESERVED_FILTER_PARAMS:
             continue
 
-        # Bare field name (implicit exact match)
-        lines.append(f"        {field_name}: {type_name} | None = None,")
-
-        for lookup in lookups:
-            lookup_field = f"{field_name}__{lookup}"
-
-            # Determine type for lookup (matching what the runtime accepts:
-            # `in` takes any iterable, between/range/month/day take a pair or
-            # triple as tuple or list, year takes a bare int)
-            if lookup == "in":
-                lookup_type = f"Iterable[{type_name}] | None"
-            elif lookup in ("between", "range"):
-                lookup_type = (
-                    f"tuple[{type_name}, {type_name}] | list[{type_name}] | None"
-                )
-            elif lookup == "isnull":
-                lookup_type = "bool | None"
-            elif lookup == "year":
-                lookup_type = "int | None"
-            elif lookup == "month":
-                lookup_type = "tuple[int, int] | list[int] | None"
-            elif lookup == "day":
-                lookup_type = "tuple[int, int, int] | list[int] | None"
-            else:
-                lookup_type = f"{type_name} | None"
-
-            lines.append(f"        {lookup_field}: {lookup_type} = None,")
-
-    lines.append("        **kwargs: Any,")
-    return "\n".join(lines)
-
-
-def _generate_order_by_literal(model_class: type[Model]) -> str:
-    """Generate the order_by fields type (includes - prefix for DESC).
-
-    The union with ``str`` keeps the literals as autocomplete suggestions while
-    still accepting values the runtime supports but the stub cannot enumerate:
-    ``"?"`` (random ordering), ``annotate()`` aliases and FK traversal paths.
-    """
-    field_info = _get_field_info(model_class)
-    literals = []
+        # Bare field name (implicit exact match), then one line per lookup
+        field_lines = [f"        {field_name}: {type_name} | None = None,"]
+        field_lines.extend(
+            f"        {field_name}__{lookup}: "
+            f"{_LOOKUP_VALUE_TYPES.get(lookup, '{t} | None').format(t=type_name)}"
+            " = None,"
+            for lookup in lookups
+        )
+        blocks.append("\n".join(field_lines))
 
-    for field_name in sorted(field_info.keys()):
-        literals.append(f'"{field_name}"')
-        literals.append(f'"-{field_name}"')
+    blocks.append("        **kwargs: Any,")
+    return "\n".join(blocks)
 
-    if not literals:
-        return "str"  # Fallback if no fields
 
-    return f"Literal[{', '.join(literals)}] | str"
+def _generate_field_sections(model_class: type[Model]) -> tuple[str, str, str]:
+    """Generate the column-driven stub sections in one pass over the fields.
 
+    Returns ``(order_by_literal, field_literal, create_params)``:
 
-def _generate_field_literal(model_class: type[Model]) -> str:
-    """Generate the field-names type (for select/values/group_by).
+    - the order_by fields type (includes ``-`` prefix for DESC);
+    - the field-names type (for select/values/group_by);
+    - the create method parameters.
 
-    Union with ``str`` for the same reason as ``_generate_order_by_literal``:
-    ``annotate()`` aliases and traversal paths are legal at runtime.
+    Both literals are unioned with ``str``: that keeps them as autocomplete
+    suggestions while still accepting values the runtime supports but the
+    stub cannot enumerate: ``"?"`` (random ordering), ``annotate()`` aliases
+    and FK traversal paths.
     """
-    field_info = _get_field_info(model_class)
-    literals = [f'"{field_name}"' for field_name in sorted(field_info.keys())]
-
-    if not literals:
-        return "str"  # Fallback if no fields
-
-    return f"Literal[{', '.join(literals)}] | str"
+    order_literals: list[str] = []
+    field_literals: list[str] = []
+    create_lines: list[str] = []
 
+    for field_name, (python_type, _is_pk) in sorted(
+        _get_field_info(model_class).items()
+    ):
+        quoted = f'"{field_name}"'
+        field_literals.append(quoted)
+        order_literals.extend((quoted, f'"-{field_name}"'))
 
-def _generate_create_params(model_class: type[Model]) -> str:
-    """Generate create method parameters with proper optionality."""
-    lines = []
-    field_info = _get_field_info(model_class)
-
-    for field_name, (python_type, _is_pk) in sorted(field_info.items()):
         if field_name in _RESERVED_CREATE_PARAMS:
             continue
         type_name = _get_python_type_name(python_type)
         # All create params are optional in stub (instance can be passed instead)
-        lines.append(f"        {field_name}: {type_name} | None = None,")
+        create_lines.append(f"        {field_name}: {type_name} | None = None,")
 
-    return "\n".join(lines)
+    if not field_literals:
+        # Fallback if no fields
+        return "str", "str", ""
+
+    return (
+        f"Literal[{', '.join(order_literals)}] | str",
+        f"Literal[{', '.join(field_literals)}] | str",
+        "\n".join(create_lines),
+    )
 
 
 def _has_overload_decorator(node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
@@ -332,8 +356,35 @@ _STUB_HEADER_IMPORTS: tuple[tuple[str, tuple[str, ...]], ...] = (
 )
 
 
-def _is_name_used(name: str, body: str) -> bool:
-    return re.search(rf"\b{re.escape(name)}\b", body) is not None
+# Names the oxyde imports below provide to every stub.
+_STUB_OXYDE_NAMES = frozenset(
+    {
+        "FlatValuesListQuery",
+        "Model",
+        "Query",
+        "QueryManager",
+        "ValuesListQuery",
+        "ValuesQuery",
+    }
+)
+
+# Parenthesized because the one-line form exceeds the 88-char line limit
+# and would trip isort's formatting check in user projects.
+_STUB_OXYDE_IMPORTS = (
+    "from oxyde import Model",
+    "from oxyde.queries import (\n"
+    "    FlatValuesListQuery,\n"
+    "    Query,\n"
+    "    QueryManager,\n"
+    "    ValuesListQuery,\n"
+    "    ValuesQuery,\n"
+    ")",
+)
+
+_STUB_BANNER = (
+    "# Auto-generated by oxyde generate-stubs",
+    "# DO NOT EDIT - This file will be overwritten",
+)
 
 
 def _assemble_imports(
@@ -349,21 +400,17 @@ def _assemble_imports(
     skeleton's meaning of that name. Stdlib ``from`` imports are merged with the
     skeleton block so each module is imported once.
     """
+    # Every word in the body, collected in one scan; a name is used when it
+    # appears as a whole word
+    body_words = set(re.findall(r"\w+", body))
+
     stdlib_from: dict[str, set[str]] = {}
     for module, names in _STUB_HEADER_IMPORTS:
-        used = {name for name in names if _is_name_used(name, body)}
+        used = body_words.intersection(names)
         if used:
             stdlib_from[module] = used
 
-    provided: set[str] = {
-        "FlatValuesListQuery",
-        "Model",
-        "Query",
-        "QueryManager",
-        "ValuesListQuery",
-        "ValuesQuery",
-    }
-    provided.update(*stdlib_from.values())
+    provided = _STUB_OXYDE_NAMES.union(*stdlib_from.values())
 
     other_lines: list[str] = []
     for node in user_imports:
@@ -371,7 +418,7 @@ def _assemble_imports(
             alias
             for alias in node.names
             if (bound := alias.asname or alias.name.split(".")[0]) not in provided
-            and _is_name_used(bound, body)
+            and bound in body_words
         ]
         if not kept:
             continue
@@ -394,26 +441,7 @@ def _assemble_imports(
     ]
     if lines:
         lines.append("")
-    # Parenthesized because the one-line form exceeds the 88-char line limit
-    # and would trip isort's formatting check in user projects.
-    oxyde_queries_import = (
-        "from oxyde.queries import (\n"
-        "    FlatValuesListQuery,\n"
-        "    Query,\n"
-        "    QueryManager,\n"
-        "    ValuesListQuery,\n"
-        "    ValuesQuery,\n"
-        ")"
-    )
-    lines.extend(
-        sorted(
-            [
-                "from oxyde import Model",
-                oxyde_queries_import,
-                *other_lines,
-            ]
-        )
-    )
+    lines.extend(sorted([*_STUB_OXYDE_IMPORTS, *other_lines]))
     return lines
 
 
@@ -482,15 +510,35 @@ def _generate_model_class_stub(
     return "\n".join(lines)
 
 
+# Rendered Query/Manager stub per model class. generate_model_stub() is run
+# for the same models by both generate_stub_for_file() and
+# generate_stubs_for_models(); like _FIELD_INFO_CACHE, entries are tied to
+# the model_fields dict they were rendered from.
+_MODEL_STUB_CACHE: weakref.WeakKeyDictionary[
+    type[Model], tuple[dict[str, Any], str]
+] = weakref.WeakKeyDictionary()
+
+
 def generate_model_stub(model_class: type[Model]) -> str:
     """Generate .pyi stub content for a single model (without imports)."""
+    model_fields = model_class.model_fields
+    cached = _MODEL_STUB_CACHE.get(model_class)
+    if cached is not None and cached[0] is model_fields:
+        return cached[1]
+
+    stub = _render_model_stub(model_class)
+    _MODEL_STUB_CACHE[model_class] = (model_fields, stub)
+    return stub
+
+
+def _render_model_stub(model_class: type[Model]) -> str:
     model_name = model_class.__name__
 
     # Generate model-dependent parameters
     filter_params = _generate_filter_params(model_class)
-    order_by_literal = _generate_order_by_literal(model_class)
-    field_literal = _generate_field_literal(model_class)
-    create_params = _generate_create_params(model_class)
+    order_by_literal, field_literal, create_params = _generate_field_sections(
+        model_class
+    )
 
     queryset_class = f"""
 class {model_name}Query(Query[{model_name}]):
@@ -1019,8 +1067,7 @@ def _build_stub(file_path: Path, models: list[type[Model]]) -> str:
     body = "\n".join(body_parts)
 
     parts: list[str] = [
-        "# Auto-generated by oxyde generate-stubs",
-        "# DO NOT EDIT - This file will be overwritten",
+        *_STUB_BANNER,
         "",
         *_assemble_imports(user_imports, body),
         "",
@@ -1029,39 +1076,95 @@ def _build_stub(file_path: Path, models: list[type[Model]]) -> str:
     return "\n".join(parts)
 
 
-def generate_stub_for_file(file_path: Path) -> None:
-    """Generate .pyi stub file for models in a Python file."""
-    # Import the module to get model classes
-    import importlib.util
+# Module name under which generate_stub_for_file() imports a loose file
+_TEMP_MODULE = "temp_module"
 
-    spec = importlib.util.spec_from_file_location("temp_module", file_path)
-    if spec is None or spec.loader is None:
-        print(f"Could not load module from {file_path}")
-        return
 
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["temp_module"] = module
-    spec.loader.exec_module(module)
+def generate_stub_for_file(file_path: Path) -> None:
+    """Generate .pyi stub file for models in a Python file.
 
-    # Find all Model subclasses in the module
-    models = []
-    for name in dir(module):
-        obj = getattr(module, name)
-        if (
-            inspect.isclass(obj)
-            and issubclass(obj, Model)
-            and obj is not Model
-            and getattr(obj, "_is_table", False)
-        ):
-            models.append(obj)
+    Table models already registered from this file (its module has been
+    imported) are used directly; otherwise the file is imported to find them.
+    """
+    target = file_path.resolve()
+    models = sorted(
+        (
+            model
+            for source_file, file_model_list in _group_models_by_file(
+                iter_tables()
+            ).items()
+            if source_file.resolve() == target
+            for model in file_model_list
+        ),
+        key=lambda model: model.__name__,
+    )
+
+    if not models:
+        # Import the module to get model classes
+        import importlib.util
+
+        spec = importlib.util.spec_from_file_location(_TEMP_MODULE, file_path)
+        if spec is None or spec.loader is None:
+            print(f"Could not load module from {file_path}")
+            return
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[_TEMP_MODULE] = module
+        spec.loader.exec_module(module)
+
+        # Find all Model subclasses in the module
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, Model)
+                and obj is not Model
+                and getattr(obj, "_is_table", False)
+            ):
+                models.append(obj)
 
     if not models:
         print(f"No table models found in {file_path}")
         return
 
     stub_path = file_path.with_suffix(".pyi")
-    stub_path.write_text(_build_stub(file_path, models))
-    print(f"Generated stub: {stub_path}")
+    if _write_stub(stub_path, _build_stub(file_path, models)):
+        print(f"Generated stub: {stub_path}")
+    else:
+        print(f"Stub unchanged: {stub_path}")
+
+
+def _group_models_by_file(
+    models: Iterable[type[Model]],
+) -> dict[Path, list[type[Model]]]:
+    """Group table models by source file (resolved once per module)."""
+    module_files: dict[str, Path | None] = {}
+    file_models: dict[Path, list[type[Model]]] = {}
+    for model in models:
+        if not getattr(model, "_is_table", False):
+            continue
+        if model.__module__ == _TEMP_MODULE:
+            # Loaded by generate_stub_for_file(); sys.modules[_TEMP_MODULE]
+            # now points at whichever file was imported last.
+            continue
+
+        if model.__module__ in module_files:
+            file_path = module_files[model.__module__]
+        else:
+            try:
+                file_path = Path(inspect.getfile(model))
+            except (TypeError, OSError):
+                # Defined outside a source file (e.g. interactively)
+                file_path = None
+            module_files[model.__module__] = file_path
+        if file_path is None:
+            continue
+
+        if file_path not in file_models:
+            file_models[file_path] = []
+        file_models[file_path].append(model)
+
+    return file_models
 
 
 def generate_stubs_for_models(
@@ -1077,32 +1180,56 @@ def generate_stubs_for_models(
         Dict mapping source file paths to stub content
     """
     if models is None:
-        models = list(registered_tables().values())
-
-    # Group models by source file
-    file_models: dict[Path, list[type[Model]]] = {}
-    for model in models:
-        if not getattr(model, "_is_table", False):
-            continue
-
-        source_file = inspect.getfile(model)
-        file_path = Path(source_file)
-
-        if file_path not in file_models:
-            file_models[file_path] = []
-        file_models[file_path].append(model)
+        models = list(iter_tables())
+    if not models:
+        return {}
 
     return {
         file_path.with_suffix(".pyi"): _build_stub(file_path, file_model_list)
-        for file_path, file_model_list in file_models.items()
+        for file_path, file_model_list in _group_models_by_file(models).items()
     }
 
 
+def _write_stub(stub_path: Path, content: str) -> bool:
+    """Write ``content`` to ``stub_path`` unless the file already holds it.
+
+    Leaving an up-to-date stub untouched keeps its mtime, so editors and type
+    checkers don't re-index it on every regeneration. Returns True if the
+    file was written.
+    """
+    try:
+        if stub_path.read_text() == content:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    stub_path.write_text(content)
+    return True
+
+
+# Upper bound on threads used by write_stubs()
+_STUB_WRITE_WORKERS = 8
+
+
 def write_stubs(stub_mapping: dict[Path, str]) -> None:
-    """Write stub files to disk."""
-    for stub_path, content in stub_mapping.items():
-        stub_path.write_text(content)
-        print(f"Generated stub: {stub_path}")
+    """Write stub files to disk.
+
+    The files are independent, so writes run on a small thread pool; progress
+    is printed from the calling thread in mapping order.
+    """
+    if not stub_mapping:
+        return
+
+    def write(item: tuple[Path, str]) -> tuple[Path, bool]:
+        stub_path, content = item
+        return stub_path, _write_stub(stub_path, content)
+
+    max_workers = min(_STUB_WRITE_WORKERS, len(stub_mapping))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for stub_path, written in executor.map(write, stub_mapping.items()):
+            if written:
+                print(f"Generated stub: {stub_path}")
+            else:
+                print(f"Stub unchanged: {stub_path}")
 
 
 __all__ = [
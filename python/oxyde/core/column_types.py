@@ -108,11 +108,19 @@ def compute_column_type(
     otherwise the Python annotation. Returns None when nothing is known —
     the column is then omitted from ``column_types``.
     """
-    enum_spec = _spec_from_enum_annotation(python_type, db_type)
-    if enum_spec is not None:
-        return enum_spec
     if db_type:
         return _spec_from_db_type(db_type)
+    if type(python_type) is type and python_type in _PY_SCALAR_KINDS:
+        # Plain scalar annotation: nothing to unwrap, cannot be an enum
+        return _scalar_spec(
+            _PY_SCALAR_KINDS[python_type],
+            max_length=max_length,
+            max_digits=max_digits,
+            decimal_places=decimal_places,
+        )
+    enum_spec = _spec_from_enum_annotation(python_type)
+    if enum_spec is not None:
+        return enum_spec
     return _spec_from_annotation(
         python_type,
         max_length=max_length,
@@ -204,6 +212,21 @@ def _spec_from_annotation(
             return _enum_spec(python_type)
         return None
 
+    return _scalar_spec(
+        kind,
+        max_length=max_length,
+        max_digits=max_digits,
+        decimal_places=decimal_places,
+    )
+
+
+def _scalar_spec(
+    kind: str,
+    *,
+    max_length: int | None,
+    max_digits: int | None,
+    decimal_places: int | None,
+) -> ColumnSpec:
     spec: ColumnSpec = {"kind": kind}
     if kind == "string" and max_length is not None:
         spec["length"] = max_length
@@ -215,13 +238,9 @@ def _spec_from_annotation(
     return spec
 
 
-def _spec_from_enum_annotation(
-    python_type: Any,
-    db_type: str | None,
-) -> ColumnSpec | None:
-    if db_type:
-        # Explicit db_type = plain verbatim column, enum machinery off.
-        return None
+def _spec_from_enum_annotation(python_type: Any) -> ColumnSpec | None:
+    # Only reached without db_type: an explicit db_type is a plain verbatim
+    # column, enum machinery off.
     enum_info = _enum_annotation_info(python_type)
     if enum_info is None:
         return None
@@ -348,15 +367,12 @@ def spec_from_legacy_name(
     if kind is None:
         return {"kind": "unknown"}
 
-    spec: ColumnSpec = {"kind": kind}
-    if kind == "string" and max_length is not None:
-        spec["length"] = max_length
-    elif kind == "decimal":
-        if max_digits is not None:
-            spec["precision"] = max_digits
-        if decimal_places is not None:
-            spec["scale"] = decimal_places
-    return spec
+    return _scalar_spec(
+        kind,
+        max_length=max_length,
+        max_digits=max_digits,
+        decimal_places=decimal_places,
+    )
 
 
 __all__ = [
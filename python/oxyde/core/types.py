@@ -28,36 +28,59 @@ class TypeDescriptor:
     serialize: Callable[[Any], Any]  # value → msgpack-safe value
 
 
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+def _isoformat(value: date | time) -> str:
+    return value.isoformat()
+
+
+def _timedelta_micros(value: timedelta) -> int:
+    return int(value.total_seconds() * 1_000_000)
+
+
 TYPE_REGISTRY: dict[type, TypeDescriptor] = {
-    bool: TypeDescriptor("bool", lambda v: v),
-    int: TypeDescriptor("numeric", lambda v: v),
-    float: TypeDescriptor("numeric", lambda v: v),
-    str: TypeDescriptor("string", lambda v: v),
-    bytes: TypeDescriptor("generic", lambda v: v),
+    bool: TypeDescriptor("bool", _passthrough),
+    int: TypeDescriptor("numeric", _passthrough),
+    float: TypeDescriptor("numeric", _passthrough),
+    str: TypeDescriptor("string", _passthrough),
+    bytes: TypeDescriptor("generic", _passthrough),
     bytearray: TypeDescriptor("generic", bytes),
-    datetime: TypeDescriptor("datetime", lambda v: v.isoformat()),
-    date: TypeDescriptor("datetime", lambda v: v.isoformat()),
+    datetime: TypeDescriptor("datetime", _isoformat),
+    date: TypeDescriptor("datetime", _isoformat),
     # Own category: comparisons apply, but a time-of-day has no calendar
     # part, so date-part lookups (year/month/day) must not be offered.
-    time: TypeDescriptor("time", lambda v: v.isoformat()),
-    timedelta: TypeDescriptor("generic", lambda v: int(v.total_seconds() * 1_000_000)),
+    time: TypeDescriptor("time", _isoformat),
+    timedelta: TypeDescriptor("generic", _timedelta_micros),
     UUID: TypeDescriptor("generic", str),
     Decimal: TypeDescriptor("numeric", str),
-    dict: TypeDescriptor("generic", lambda v: v),
+    dict: TypeDescriptor("generic", _passthrough),
 }
 
 
+# Exact types msgpack encodes natively: returned before any isinstance or
+# registry check, and containers skip the recursive call for these items
+# (subclasses such as str-based enums still take the full path)
+_NATIVE_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
 def serialize_value(value: Any) -> Any:
     """Serialize a value for msgpack/IR using TYPE_REGISTRY.
 
     Handles lists and dicts recursively. Returns value unchanged if type is not
-    in the registry (int, str, float, bool, None pass through as-is
+    in the registry (int, str, float, bool, bytes, None pass through as-is
     since msgpack handles them natively).
     """
+    if type(value) in _NATIVE_TYPES:
+        return value
     if isinstance(value, list):
-        return [serialize_value(v) for v in value]
+        return [v if type(v) in _NATIVE_TYPES else serialize_value(v) for v in value]
     if isinstance(value, dict):
-        return {k: serialize_value(v) for k, v in value.items()}
+        return {
+            k: v if type(v) in _NATIVE_TYPES else serialize_value(v)
+            for k, v in value.items()
+        }
     if isinstance(value, Enum):
         return value.value
     desc = TYPE_REGISTRY.get(type(value))
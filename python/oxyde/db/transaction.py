@@ -59,6 +59,13 @@ Savepoint Handling:
     Inner exception rolls back to savepoint, not entire transaction.
     This matches Django/PostgreSQL behavior.
 
+SQLite Writer Queue:
+    SQLite allows a single writer, so top-level transactions on a SQLite
+    database take AsyncDatabase._writer_lock for their whole lifetime and
+    run one at a time. Nested atomic() blocks are savepoints on the same
+    transaction and do not take it again. Plain queries outside atomic()
+    are not queued.
+
 Rust Integration:
     _begin_transaction(pool_name) → tx_id
     _execute_in_transaction(pool_name, tx_id, ir_bytes) → bytes
@@ -145,6 +152,7 @@ class AsyncTransaction:
         self._timeout = timeout
         self._deadline: float | None = None
         self._timed_out = False
+        self._writer_lock: asyncio.Lock | None = None
 
     @property
     def id(self) -> int:
@@ -185,9 +193,56 @@ class AsyncTransaction:
         result: bytes = await coro
         return result
 
+    async def _acquire_writer_lock(self) -> None:
+        """Queue behind other transactions on the same SQLite database.
+
+        SQLite allows one writer at a time. Waiting on an asyncio.Lock keeps
+        transactions in FIFO order without holding a pooled connection, and
+        is bounded by ``sqlite_busy_timeout`` like the database lock itself.
+        """
+        database = self._database
+        if database.backend != "sqlite":
+            return
+
+        busy_timeout = database.settings.sqlite_busy_timeout
+        wait = busy_timeout / 1000 if busy_timeout is not None else None
+        lock = database._get_writer_lock()
+
+        def release_if_acquired(task: asyncio.Future[Any]) -> None:
+            if not task.cancelled() and task.exception() is None:
+                lock.release()
+
+        acquire = asyncio.ensure_future(lock.acquire())
+        try:
+            await asyncio.wait_for(asyncio.shield(acquire), wait)
+        except BaseException as exc:
+            # The acquire may already have won when wait_for() gives up
+            # (Python 3.10/3.11) or when we are cancelled: hand the lock back
+            # once it settles instead of leaking it.
+            acquire.cancel()
+            acquire.add_done_callback(release_if_acquired)
+            if isinstance(exc, asyncio.TimeoutError):
+                msg = (
+                    f"Timed out waiting for another transaction on "
+                    f"'{database.name}' to finish"
+                )
+                raise TransactionTimeoutError(msg) from exc
+            raise
+        self._writer_lock = lock
+
+    def _release_writer_lock(self) -> None:
+        if self._writer_lock is not None:
+            lock, self._writer_lock = self._writer_lock, None
+            lock.release()
+
     async def __aenter__(self) -> AsyncTransaction:
         await self._database.ensure_connected()
-        self._tx_id = await _begin_transaction(self._database.name)
+        await self._acquire_writer_lock()
+        try:
+            self._tx_id = await _begin_transaction(self._database.name)
+        except BaseException:
+            self._release_writer_lock()
+            raise
         if self._timeout is not None:
             loop = asyncio.get_running_loop()
             self._deadline = loop.time() + self._timeout
@@ -208,6 +263,7 @@ class AsyncTransaction:
                 await _commit_transaction(tx_id)
         finally:
             self._timed_out = False
+            self._release_writer_lock()
 
 
 class AtomicTransactionContext:
@@ -23,9 +23,11 @@ from oxyde.migrations.squash import SquashResult, squash_migrations
 from oxyde.migrations.tracker import (
     ensure_migrations_table,
     get_applied_migrations,
+    get_applied_migrations_among,
     get_migration_files,
     get_pending_migrations,
     record_migration,
+    record_migrations,
     remove_migration,
 )
 
@@ -42,8 +44,10 @@ __all__ = [
     "rollback_migrations",
     "ensure_migrations_table",
     "get_applied_migrations",
+    "get_applied_migrations_among",
     "get_migration_files",
     "get_pending_migrations",
     "record_migration",
+    "record_migrations",
     "remove_migration",
 ]
@@ -15,6 +15,7 @@ from oxyde.core import (
 )
 from oxyde.core.ir import build_raw_sql_ir
 from oxyde.db.pool import _msgpack_encoder
+from oxyde.migrations.utils import normalize_op_fields
 
 if TYPE_CHECKING:
     from oxyde.db.pool import AsyncDatabase as DatabaseConnection
@@ -521,8 +522,6 @@ class MigrationContext:
         """
         # Normalize legacy field dicts (python_type form) — Rust requires
         # column_type. Single legacy funnel for the execute path.
-        from oxyde.migrations.utils import normalize_op_fields
-
         op = normalize_op_fields(op)
 
         # Convert operation to SQL using Rust
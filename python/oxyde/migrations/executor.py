@@ -22,14 +22,15 @@ from oxyde.migrations.replay import (
     _topological_sort_migrations,
 )
 from oxyde.migrations.tracker import (
+    _insert_migration_records,
     ensure_migrations_table,
     get_applied_migrations,
     get_pending_migrations,
-    record_migration,
     remove_migration,
 )
 from oxyde.migrations.utils import (
     detect_dialect,
+    list_migration_files,
     load_migration_module,
     parse_query_result,
 )
@@ -196,9 +197,7 @@ def replay_migrations_up_to(
         SchemaState after replaying migrations
     """
     state = SchemaState()
-    migration_files = _topological_sort_migrations(
-        sorted(Path(migrations_dir).glob("[0-9]*.py"))
-    )
+    migration_files = _topological_sort_migrations(list_migration_files(migrations_dir))
 
     for filepath in migration_files:
         # Stop before target (or at target if include_target is False)
@@ -323,11 +322,16 @@ async def apply_migrations(
                 for op in ctx_collect.get_collected_operations():
                     schema_state.apply_operation(op)
 
-            # Record migration as applied
-            await record_migration(migration_name, db_alias)
+                # Record migration as applied (table ensured above)
+                await _insert_migration_records([migration_name], db_alias)
+
             applied_migrations.append(migration_name)
             applied_set.add(migration_name)  # Update for dependency checking
 
+        if fake:
+            # Nothing was executed: mark the whole run applied in one INSERT
+            await _insert_migration_records(applied_migrations, db_alias)
+
     finally:
         # Always release the lock
         await _release_migration_lock(db_conn, dialect, lock_tx_id)
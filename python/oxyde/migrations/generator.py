@@ -6,6 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from oxyde.migrations.utils import list_migration_files
+
 
 def _python_repr(obj: Any, indent: int = 0, base_indent: int = 4) -> str:
     """Convert Python object to proper Python repr string.
@@ -275,12 +277,8 @@ def _get_next_migration_number(migrations_dir: str | Path) -> str:
     Returns:
         Next migration number as 4-digit string (e.g., "0001")
     """
-    migrations_path = Path(migrations_dir)
-    if not migrations_path.exists():
-        return "0001"
-
     # Find existing migrations
-    existing = sorted(migrations_path.glob("[0-9]*.py"))
+    existing = list_migration_files(migrations_dir)
     if not existing:
         return "0001"
 
@@ -302,11 +300,7 @@ def _get_previous_migration(migrations_dir: str | Path) -> str | None:
     Returns:
         Name of the previous migration (without .py) or None if no migrations exist
     """
-    migrations_path = Path(migrations_dir)
-    if not migrations_path.exists():
-        return None
-
-    existing = sorted(migrations_path.glob("[0-9]*.py"))
+    existing = list_migration_files(migrations_dir)
     if not existing:
         return None
 
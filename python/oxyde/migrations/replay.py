@@ -8,6 +8,7 @@ from typing import Any
 
 from oxyde.migrations.context import MigrationContext
 from oxyde.migrations.utils import (
+    list_migration_files,
     load_migration_module,
     normalize_field_dict,
     op_uses_legacy_fields,
@@ -333,7 +334,7 @@ def replay_migrations(migrations_dir: str = "migrations") -> dict[str, Any]:
         Schema snapshot after replaying all migrations
     """
     state = SchemaState()
-    migration_files = sorted(Path(migrations_dir).glob("[0-9]*.py"))
+    migration_files = list_migration_files(migrations_dir)
 
     # Sort migrations by dependencies
     sorted_files = _topological_sort_migrations(migration_files)
@@ -29,7 +29,11 @@ from oxyde.core import migration_compute_diff
 from oxyde.migrations.context import MigrationContext
 from oxyde.migrations.generator import generate_migration_file
 from oxyde.migrations.replay import SchemaState, _topological_sort_migrations
-from oxyde.migrations.utils import load_migration_module, op_uses_legacy_fields
+from oxyde.migrations.utils import (
+    list_migration_files,
+    load_migration_module,
+    op_uses_legacy_fields,
+)
 
 
 @dataclass
@@ -53,7 +57,7 @@ def squash_migrations(
     to squash (no migration files found).
     """
     migrations_path = Path(migrations_dir)
-    files = sorted(migrations_path.glob("[0-9]*.py"))
+    files = list_migration_files(migrations_path)
     if not files:
         return SquashResult(new_file=None)
 
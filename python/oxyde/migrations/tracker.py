@@ -7,10 +7,18 @@ from pathlib import Path
 from oxyde.core.ir import build_raw_sql_ir
 from oxyde.db.registry import get_connection as _get_connection_async
 from oxyde.migrations.replay import _topological_sort_migrations
-from oxyde.migrations.utils import detect_dialect, parse_query_result
+from oxyde.migrations.utils import (
+    detect_dialect,
+    list_migration_files,
+    parse_query_column,
+)
 
 MIGRATIONS_TABLE = "oxyde_migrations"
 
+# Most names bound in one IN (...) filter. Stays under SQLite's historic
+# limit of 999 parameters; longer lists are filtered in Python instead.
+_MAX_IN_PARAMS = 900
+
 
 async def ensure_migrations_table(db_alias: str = "default") -> None:
     """Create migrations tracking table if it doesn't exist.
@@ -76,8 +84,52 @@ async def get_applied_migrations(db_alias: str = "default") -> list[str]:
 
     query_ir = build_raw_sql_ir(sql=query_sql)
     result_bytes = await db_conn.execute(query_ir)
-    rows = parse_query_result(result_bytes)
-    return [row["name"] for row in rows if "name" in row]
+    return parse_query_column(result_bytes, "name")
+
+
+async def get_applied_migrations_among(
+    names: list[str],
+    db_alias: str = "default",
+) -> list[str]:
+    """Get which of ``names`` are recorded as applied.
+
+    Filters on the database side, so only the rows for ``names`` are
+    fetched rather than the whole history. Above ``_MAX_IN_PARAMS`` names
+    the full history is read and filtered here, to stay within the
+    database's bound-parameter limit.
+
+    Args:
+        names: Candidate migration names (e.g. stems of files on disk)
+        db_alias: Database connection alias
+
+    Returns:
+        Applied names among ``names``, in the order they were recorded
+    """
+    if not names:
+        return []
+    if len(names) > _MAX_IN_PARAMS:
+        wanted = set(names)
+        applied = await get_applied_migrations(db_alias)
+        return [name for name in applied if name in wanted]
+
+    await ensure_migrations_table(db_alias)
+
+    db_conn = await _get_connection_async(db_alias)
+
+    if detect_dialect(db_conn.url) == "postgres":
+        placeholders = ", ".join(f"${i}" for i in range(1, len(names) + 1))
+    else:
+        placeholders = ", ".join(["?"] * len(names))
+
+    query_sql = f"""
+    SELECT name FROM {MIGRATIONS_TABLE}
+    WHERE name IN ({placeholders})
+    ORDER BY id ASC
+    """
+
+    query_ir = build_raw_sql_ir(sql=query_sql, params=list(names))
+    result_bytes = await db_conn.execute(query_ir)
+    return parse_query_column(result_bytes, "name")
 
 
 async def record_migration(name: str, db_alias: str = "default") -> None:
@@ -87,36 +139,46 @@ async def record_migration(name: str, db_alias: str = "default") -> None:
         name: Migration name (e.g., "0001_initial")
         db_alias: Database connection alias
     """
+    await record_migrations([name], db_alias)
+
+
+async def record_migrations(names: list[str], db_alias: str = "default") -> None:
+    """Record that several migrations have been applied, in one INSERT.
+
+    Args:
+        names: Migration names, in the order they were applied
+        db_alias: Database connection alias
+    """
+    if not names:
+        return
+
     await ensure_migrations_table(db_alias)
+    await _insert_migration_records(names, db_alias)
+
 
+async def _insert_migration_records(names: list[str], db_alias: str) -> None:
+    """INSERT history rows for ``names``; the table must already exist."""
     db_conn = await _get_connection_async(db_alias)
 
     dialect = detect_dialect(db_conn.url)
 
-    # Insert migration record with dialect-specific SQL
+    # One VALUES row per migration, with dialect-specific SQL
     if dialect == "postgres":
-        insert_sql = f"""
-        INSERT INTO {MIGRATIONS_TABLE} (name, applied_at)
-        VALUES ($1, NOW())
-        """
-        params = [name]
+        rows = [f"(${i}, NOW())" for i in range(1, len(names) + 1)]
     elif dialect == "mysql":
-        insert_sql = f"""
-        INSERT INTO {MIGRATIONS_TABLE} (name, applied_at)
-        VALUES (?, NOW())
-        """
-        params = [name]
+        rows = ["(?, NOW())"] * len(names)
     else:
         # SQLite
-        insert_sql = f"""
-        INSERT INTO {MIGRATIONS_TABLE} (name, applied_at)
-        VALUES (?, datetime('now'))
-        """
-        params = [name]
+        rows = ["(?, datetime('now'))"] * len(names)
+
+    insert_sql = f"""
+    INSERT INTO {MIGRATIONS_TABLE} (name, applied_at)
+    VALUES {", ".join(rows)}
+    """
 
     insert_ir = build_raw_sql_ir(
         sql=insert_sql,
-        params=params,
+        params=list(names),
     )
     await db_conn.execute(insert_ir)
 
@@ -156,12 +218,8 @@ def get_migration_files(migrations_dir: str = "migrations") -> list[Path]:
     Returns:
         List of migration file paths
     """
-    migrations_path = Path(migrations_dir)
-    if not migrations_path.exists():
-        return []
-
     # Find all migration files (0001_*.py, 0002_*.py, etc.)
-    migration_files = sorted(migrations_path.glob("[0-9]*.py"))
+    migration_files = list_migration_files(migrations_dir)
     return _topological_sort_migrations(migration_files)
 
 
@@ -179,22 +237,20 @@ def get_pending_migrations(
         List of pending migration file paths
     """
     all_migrations = get_migration_files(migrations_dir)
-    applied_set = set(applied or [])
-
-    pending = []
-    for filepath in all_migrations:
-        # Extract migration name (0001_initial.py -> 0001_initial)
-        name = filepath.stem
-        if name not in applied_set:
-            pending.append(filepath)
+    if not applied:
+        return all_migrations
+    applied_set = set(applied)
 
-    return pending
+    # Migration name is the file stem (0001_initial.py -> 0001_initial)
+    return [path for path in all_migrations if path.stem not in applied_set]
 
 
 __all__ = [
     "ensure_migrations_table",
     "get_applied_migrations",
+    "get_applied_migrations_among",
     "record_migration",
+    "record_migrations",
     "remove_migration",
     "get_migration_files",
     "get_pending_migrations",
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
+import time
 from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
@@ -30,6 +32,51 @@ def detect_dialect(url: str) -> str:
     return "postgres"
 
 
+# Directory listings per migrations dir, keyed by the directory's mtime:
+# adding, removing or renaming a migration file changes it.
+_LISTING_CACHE: dict[str, tuple[int, list[Path]]] = {}
+
+# A listing taken within this window of the directory's last change is not
+# cached: a file created in the same timestamp tick would not move the mtime.
+_LISTING_RACY_WINDOW_NS = 2_000_000_000
+
+
+def list_migration_files(migrations_dir: str | Path) -> list[Path]:
+    """List migration files (``0001_*.py``, ``0002_*.py``, ...) sorted by name.
+
+    Args:
+        migrations_dir: Path to migrations directory
+
+    Returns:
+        Migration file paths; empty if the directory does not exist
+    """
+    migrations_path = Path(migrations_dir)
+    key = os.fspath(migrations_path)
+    try:
+        mtime_ns = os.stat(migrations_path).st_mtime_ns
+    except FileNotFoundError:
+        _LISTING_CACHE.pop(key, None)
+        return []
+
+    cached = _LISTING_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return list(cached[1])
+
+    with os.scandir(migrations_path) as entries:
+        names = sorted(
+            entry.name
+            for entry in entries
+            if entry.name[:1].isdigit()
+            and entry.name.endswith(".py")
+            and entry.is_file()
+        )
+    files = [migrations_path / name for name in names]
+
+    if time.time_ns() - mtime_ns > _LISTING_RACY_WINDOW_NS:
+        _LISTING_CACHE[key] = (mtime_ns, files)
+    return list(files)
+
+
 def load_migration_module(filepath: Path) -> Any | None:
     """Load a migration module from file.
 
@@ -76,6 +123,40 @@ def parse_query_result(result_bytes: bytes) -> list[dict[str, Any]]:
     return []
 
 
+def parse_query_column(result_bytes: bytes, column: str) -> list[Any]:
+    """Parse MessagePack query result into the values of a single column.
+
+    Reads the column straight out of the columnar rows, without building a
+    dict per row.
+
+    Args:
+        result_bytes: Raw MessagePack bytes from query
+        column: Column name to extract
+
+    Returns:
+        Column values in row order (empty if the column is missing)
+    """
+    if not result_bytes:
+        return []
+
+    result = msgpack.unpackb(result_bytes, raw=False)
+
+    # Format: [columns, rows] where columns is list of names, rows is list of lists
+    if isinstance(result, list) and len(result) == 2:
+        columns, rows = result
+        if isinstance(columns, list) and isinstance(rows, list):
+            if column not in columns:
+                return []
+            index = columns.index(column)
+            return [row[index] for row in rows]
+
+    # Fallback: already list of dicts
+    if isinstance(result, list) and all(isinstance(r, dict) for r in result):
+        return [row[column] for row in result if column in row]
+
+    return []
+
+
 # ── Legacy field-format normalization ────────────────────────────────────
 
 
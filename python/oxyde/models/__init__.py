@@ -25,6 +25,7 @@ Model Registry:
     unregister_table(): Remove model from registry.
     registered_tables(): Get dict of all registered models.
     iter_tables(): Iterate over registered models.
+    tables_view(): Read-only live view of registered models.
     clear_registry(): Remove all registered models.
 
 Example:
@@ -54,6 +55,7 @@ from .registry import (
     iter_tables,
     register_table,
     registered_tables,
+    tables_view,
     unregister_table,
 )
 
@@ -79,5 +81,6 @@ __all__ = [
     "unregister_table",
     "registered_tables",
     "iter_tables",
+    "tables_view",
     "clear_registry",
 ]
@@ -215,6 +215,7 @@ class Model(BaseModel, metaclass=OxydeModelMeta):
     _is_table: ClassVar[bool] = False
     __pending_fk_fields__: ClassVar[list[tuple[str, Any, Any]]] = []
     __fk_fields_resolved__: ClassVar[bool] = False
+    __fk_unresolved_name__: ClassVar[str | None] = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -355,9 +356,10 @@ class Model(BaseModel, metaclass=OxydeModelMeta):
                 globalns=_build_globalns(cls),
                 localns=dict(cls.__dict__),
             )
-        except NameError:
+        except NameError as exc:
             # Forward reference not yet resolvable - skip for now
             cls.__fk_fields_resolved__ = False
+            cls.__fk_unresolved_name__ = exc.name
             return
 
         fields_to_add: list[tuple[str, Any, FieldInfo]] = []
@@ -443,6 +445,7 @@ class Model(BaseModel, metaclass=OxydeModelMeta):
                 cls.__annotations__.pop(fk_column_name, None)
                 cls.__pydantic_fields__.pop(fk_column_name, None)
             cls.__fk_fields_resolved__ = False
+            cls.__fk_unresolved_name__ = None
 
     @classmethod
     def _parse_field_tags(cls) -> None:
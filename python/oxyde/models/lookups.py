@@ -63,6 +63,7 @@ from __future__ import annotations
 import collections.abc
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from oxyde.core.types import TYPE_REGISTRY
@@ -113,7 +114,12 @@ def _lookup_category(meta: ColumnMeta) -> str:
 
 def _allowed_lookups_for_meta(meta: ColumnMeta) -> list[str]:
     """Get list of allowed lookups for a given field metadata."""
-    category = _lookup_category(meta)
+    return list(_lookups_for_category(_lookup_category(meta)))
+
+
+@cache
+def _lookups_for_category(category: str) -> tuple[str, ...]:
+    """Allowed lookups per category (the tables are static, so cache them)."""
     lookups: list[str] = ["exact"]
     if category == "string":
         lookups.extend(STRING_LOOKUPS)
@@ -138,7 +144,7 @@ def _allowed_lookups_for_meta(meta: ColumnMeta) -> list[str]:
         if item not in seen:
             seen.add(item)
             result.append(item)
-    return result
+    return tuple(result)
 
 
 def _split_lookup_key(key: str) -> tuple[str, str]:
@@ -188,7 +194,7 @@ def _parse_lookup_path(key: str) -> tuple[list[str], str]:
     return parts, "exact"
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedPath:
     """Result of resolving a field path through FK relationships."""
 
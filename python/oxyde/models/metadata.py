@@ -125,6 +125,11 @@ class ModelMeta:
     # Primary key field name and db column (cached at finalization)
     pk_field: str | None = None
     pk_column: str | None = None
+    # Resolved lookups on own fields: "price__gt" → ("price", "gt", ColumnMeta)
+    # (filled lazily by Q on first use; FK paths are not cached)
+    lookup_cache: dict[str, tuple[str, str, ColumnMeta]] = dataclass_field(
+        default_factory=dict
+    )
 
 
 class RelationDescriptorBase:
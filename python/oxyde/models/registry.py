@@ -21,7 +21,11 @@ Functions:
         Return copy of registry.
 
     iter_tables() -> tuple[type[Model], ...]:
-        Return tuple of registered model classes.
+        Return tuple of registered model classes. Preferred when only
+        the models are needed: no dict copy is made.
+
+    tables_view() -> Mapping[str, type[Model]]:
+        Return a live read-only view of the registry (no copy).
 
     clear_registry():
         Remove all models (used in tests for cleanup).
@@ -47,17 +51,54 @@ Migration Integration:
 
 from __future__ import annotations
 
+import sys
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from oxyde.models.base import Model
 
 _TABLES: dict[str, type[Model]] = {}
+# Live read-only view of _TABLES, handed out by tables_view()
+_TABLES_VIEW: MappingProxyType[str, type[Model]] = MappingProxyType(_TABLES)
 _PENDING_MODELS: set[type[Model]] = set()
+# FIFO of pending models, drained by finalize_pending(). _PENDING_MODELS is
+# the source of truth: entries removed from it are dropped when reached.
+_PENDING_QUEUE: deque[type[Model]] = deque()
+# Pending model -> undefined name that blocked its finalization. Forward refs
+# resolve against the model's module globals only, so such a model is not
+# retried until that name shows up there.
+_WAITING_ON: dict[type[Model], str] = {}
 
 
 def _model_key(model: type[Model]) -> str:
-    return f"{model.__module__}.{model.__qualname__}"
+    """Return the "{module}.{qualname}" key, computed once per class."""
+    # Read the class's own __dict__: a subclass must not inherit the key.
+    key = model.__dict__.get("__oxyde_key__")
+    if key is None:
+        key = sys.intern(f"{model.__module__}.{model.__qualname__}")
+        setattr(model, "__oxyde_key__", key)
+    return key
+
+
+def _wait_for(model: type[Model], name: str | None) -> bool:
+    """Record the name ``model`` is blocked on; always returns False."""
+    if name is None:
+        _WAITING_ON.pop(model, None)
+    else:
+        _WAITING_ON[model] = name
+    return False
+
+
+def _is_blocked(model: type[Model]) -> bool:
+    """Whether the name ``model`` last failed on is still undefined."""
+    name = _WAITING_ON.get(model)
+    if name is None:
+        return False
+    module = sys.modules.get(model.__module__)
+    return module is None or name not in vars(module)
 
 
 def _finalize_model(model: type[Model]) -> bool:
@@ -73,14 +114,14 @@ def _finalize_model(model: type[Model]) -> bool:
             model.__fk_fields_resolved__ = False
             model._resolve_fk_fields()
             if not getattr(model, "__fk_fields_resolved__", False):
-                return False
+                return _wait_for(model, model.__fk_unresolved_name__)
 
     # Step 2: Parse field tags → field_metadata
     if not model._db_meta.field_metadata:
         try:
             model._parse_field_tags()
-        except NameError:
-            return False
+        except NameError as exc:
+            return _wait_for(model, exc.name)
 
     # Step 3: Compute column_types for IR
     if model._db_meta.column_types is None:
@@ -94,6 +135,7 @@ def _finalize_model(model: type[Model]) -> bool:
                 model._db_meta.pk_column = meta.db_column
                 break
 
+    _WAITING_ON.pop(model, None)
     return True
 
 
@@ -102,11 +144,24 @@ def finalize_pending() -> None:
 
     Called from OxydeModelMeta.__new__ after Pydantic completes model creation.
     Models that can't be finalized (forward refs not yet available) stay in
-    _PENDING_MODELS and are retried on next class definition.
+    _PENDING_MODELS and are retried on a later class definition, once the
+    name they failed on is defined in their module.
     """
-    for model in list(_PENDING_MODELS):
-        if _finalize_model(model):
-            _PENDING_MODELS.discard(model)
+    for _ in range(len(_PENDING_QUEUE)):
+        if not _PENDING_QUEUE:
+            # Drained by a nested call (a model rebuild defined a class).
+            break
+        model = _PENDING_QUEUE.popleft()
+        if model not in _PENDING_MODELS:
+            continue
+        done = False
+        try:
+            done = not _is_blocked(model) and _finalize_model(model)
+        finally:
+            if done:
+                _PENDING_MODELS.discard(model)
+            else:
+                _PENDING_QUEUE.append(model)
 
 
 def register_table(model: type[Model], *, overwrite: bool = False) -> None:
@@ -123,14 +178,18 @@ def register_table(model: type[Model], *, overwrite: bool = False) -> None:
         if not overwrite:
             raise ValueError(f"Table '{key}' is already registered")
         _PENDING_MODELS.discard(existing)
+        _WAITING_ON.pop(existing, None)
     _TABLES[key] = model
-    _PENDING_MODELS.add(model)
+    if model not in _PENDING_MODELS:
+        _PENDING_MODELS.add(model)
+        _PENDING_QUEUE.append(model)
 
 
 def unregister_table(model: type[Model]) -> None:
     """Remove a model from the registry if present."""
     _TABLES.pop(_model_key(model), None)
     _PENDING_MODELS.discard(model)
+    _WAITING_ON.pop(model, None)
 
 
 def registered_tables() -> dict[str, type[Model]]:
@@ -143,10 +202,21 @@ def iter_tables() -> tuple[type[Model], ...]:
     return tuple(_TABLES.values())
 
 
+def tables_view() -> Mapping[str, type[Model]]:
+    """Return a live read-only view of the registered table mapping.
+
+    Unlike registered_tables() no copy is made, so lookups are cheap; do not
+    register or unregister models while iterating it.
+    """
+    return _TABLES_VIEW
+
+
 def clear_registry() -> None:
     """Reset the registry (intended for tests)."""
     _TABLES.clear()
     _PENDING_MODELS.clear()
+    _PENDING_QUEUE.clear()
+    _WAITING_ON.clear()
 
 
 def assert_no_pending_models() -> None:
@@ -164,6 +234,7 @@ __all__ = [
     "unregister_table",
     "registered_tables",
     "iter_tables",
+    "tables_view",
     "clear_registry",
     "finalize_pending",
     "assert_no_pending_models",
@@ -15,8 +15,8 @@ Virtual Fields:
         comments: list[Comment] = Field(db_reverse_fk="post")  # Virtual
 
 Functions:
-    _get_virtual_fields(model_class) -> set[str]:
-        Return names of virtual (relation) fields.
+    _get_virtual_fields(model_class) -> frozenset[str]:
+        Return names of virtual (relation) fields, cached per model.
 
     _dump_insert_data(instance) -> dict:
         Serialize instance for INSERT. Uses model_dump(exclude_none=True).
@@ -44,9 +44,14 @@ from oxyde.exceptions import ManagerError
 
 if TYPE_CHECKING:
     from oxyde.models.base import Model
+    from oxyde.models.metadata import ColumnMeta
 
+# model class -> (field_metadata it was computed from, virtual field names).
+# _parse_field_tags() assigns a new field_metadata dict, which invalidates it.
+_VIRTUAL_FIELDS_CACHE: dict[type, tuple[dict[str, ColumnMeta], frozenset[str]]] = {}
 
-def _get_virtual_fields(model_class: type[Model]) -> set[str]:
+
+def _get_virtual_fields(model_class: type[Model]) -> frozenset[str]:
     """Get field names that are virtual and don't correspond to database columns.
 
     Virtual fields include:
@@ -54,26 +59,40 @@ def _get_virtual_fields(model_class: type[Model]) -> set[str]:
     - db_m2m: many-to-many relations (e.g., tags: list[Tag])
     - FK model fields: (e.g., author: Author) — real column is author_id
     """
-    virtual: set[str] = set()
-    for name, meta in model_class._db_meta.field_metadata.items():
-        if meta.extra.get("reverse_fk") or meta.extra.get("m2m"):
-            virtual.add(name)
-        elif meta.foreign_key is not None:
-            virtual.add(name)
+    field_metadata = model_class._db_meta.field_metadata
+    cached = _VIRTUAL_FIELDS_CACHE.get(model_class)
+    if cached is not None and cached[0] is field_metadata:
+        return cached[1]
+
+    virtual = frozenset(
+        name
+        for name, meta in field_metadata.items()
+        if meta.extra.get("reverse_fk")
+        or meta.extra.get("m2m")
+        or meta.foreign_key is not None
+    )
+    _VIRTUAL_FIELDS_CACHE[model_class] = (field_metadata, virtual)
     return virtual
 
 
+def _dump_excluded_fields(model_class: type[Model]) -> frozenset[str]:
+    """Virtual relation fields plus Pydantic computed fields."""
+    excluded = _get_virtual_fields(model_class)
+    computed_fields = model_class.__pydantic_computed_fields__
+    if computed_fields:
+        excluded = excluded.union(computed_fields)
+    return excluded
+
+
 def _dump_insert_data(instance: Model) -> dict[str, Any]:
     """Serialize model instance for INSERT operation.
 
     Excludes virtual relation fields (db_reverse_fk, db_m2m) and Pydantic
     computed fields that don't correspond to actual database columns.
     """
-    virtual_fields = _get_virtual_fields(instance.__class__)
-    computed_fields = set(instance.__class__.model_computed_fields.keys())
-    data = instance.model_dump(
-        mode="python", exclude_unset=True, exclude=virtual_fields | computed_fields
-    )
+    # pydantic's IncEx hint says set[str], but any set (frozenset too) works
+    excluded: Any = _dump_excluded_fields(instance.__class__)
+    data = instance.model_dump(mode="python", exclude_unset=True, exclude=excluded)
     return data
 
 
@@ -83,15 +102,15 @@ def _dump_update_data(instance: Model, fields: Iterable[str]) -> dict[str, Any]:
     Excludes virtual relation fields (db_reverse_fk, db_m2m) and Pydantic
     computed fields that don't correspond to actual database columns.
     """
-    virtual_fields = _get_virtual_fields(instance.__class__)
-    computed_fields = set(instance.__class__.model_computed_fields.keys())
-    excluded = virtual_fields | computed_fields
-    snapshot = instance.model_dump(mode="python", exclude_none=False)
-    return {
-        field: snapshot[field]
-        for field in fields
-        if field in snapshot and field not in excluded
+    model_class = instance.__class__
+    excluded = _dump_excluded_fields(model_class)
+    model_fields = model_class.__pydantic_fields__
+    include = {
+        field for field in fields if field in model_fields and field not in excluded
     }
+    if not include:
+        return {}
+    return instance.model_dump(mode="python", include=include, exclude_none=False)
 
 
 def _derive_create_data(
@@ -32,14 +32,14 @@ Functions:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from types import NoneType, UnionType
 from typing import Annotated, Any, Union, get_args, get_origin
 
 from pydantic.fields import FieldInfo
 
 
-def _unpack_annotated(hint: Any) -> tuple[Any, tuple[Any, ...]]:
-    """Extract base type and metadata from Annotated type hint."""
+def _do_unpack_annotated(hint: Any) -> tuple[Any, tuple[Any, ...]]:
     if get_origin(hint) is Annotated:
         args = get_args(hint)
         if args:
@@ -47,8 +47,7 @@ def _unpack_annotated(hint: Any) -> tuple[Any, tuple[Any, ...]]:
     return hint, ()
 
 
-def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
-    """Check if type is Optional/Union with None and extract base type."""
+def _do_unwrap_optional(hint: Any) -> tuple[Any, bool]:
     origin = get_origin(hint)
     if origin in (Union, UnionType):
         args = []
@@ -63,6 +62,30 @@ def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
     return hint, False
 
 
+# Hints are re-inspected for every field on every metadata parse and again by
+# lookups/stub generation. Bounded so hints naming throwaway model classes
+# (``Author | None``) don't keep those classes alive.
+_cached_unpack_annotated = lru_cache(maxsize=256)(_do_unpack_annotated)
+_cached_unwrap_optional = lru_cache(maxsize=256)(_do_unwrap_optional)
+
+
+def _unpack_annotated(hint: Any) -> tuple[Any, tuple[Any, ...]]:
+    """Extract base type and metadata from Annotated type hint."""
+    try:
+        return _cached_unpack_annotated(hint)
+    except TypeError:
+        # Unhashable hint, e.g. Annotated with dict metadata
+        return _do_unpack_annotated(hint)
+
+
+def _unwrap_optional(hint: Any) -> tuple[Any, bool]:
+    """Check if type is Optional/Union with None and extract base type."""
+    try:
+        return _cached_unwrap_optional(hint)
+    except TypeError:
+        return _do_unwrap_optional(hint)
+
+
 _CONSTRAINT_ATTRS = ("max_length", "max_digits", "decimal_places")
 
 
@@ -36,8 +36,9 @@ Helper Functions:
         Get pool name for schema/explain operations.
 
 Caching:
-    _TYPE_ADAPTER_CACHE: Thread-safe cache for Pydantic TypeAdapter instances.
-    Used for efficient list[Model] validation in fetch_models().
+    _list_adapter(model_class) -> TypeAdapter:
+        Cached list[Model] TypeAdapter used by fetch_models(). Hits are a
+        single dict lookup; the lock only guards building a new adapter.
 """
 
 from __future__ import annotations
@@ -67,7 +68,7 @@ from oxyde.exceptions import (
     UniqueViolationError,
 )
 from oxyde.models.metadata import ColumnMeta
-from oxyde.models.registry import registered_tables
+from oxyde.models.registry import _model_key, tables_view
 from oxyde.models.serializers import _get_virtual_fields
 
 if TYPE_CHECKING:
@@ -78,6 +79,19 @@ if TYPE_CHECKING:
 _TYPE_ADAPTER_CACHE: dict[type, TypeAdapter] = {}
 _TYPE_ADAPTER_LOCK = threading.Lock()
 
+
+def _list_adapter(model_class: type[Model]) -> TypeAdapter:
+    """Return the cached ``TypeAdapter(list[model_class])``."""
+    adapter = _TYPE_ADAPTER_CACHE.get(model_class)
+    if adapter is None:
+        with _TYPE_ADAPTER_LOCK:
+            adapter = _TYPE_ADAPTER_CACHE.get(model_class)
+            if adapter is None:
+                adapter = TypeAdapter(list[model_class])  # type: ignore[valid-type]
+                _TYPE_ADAPTER_CACHE[model_class] = adapter
+    return adapter
+
+
 # Core exception → oxyde exception, most specific first (core classes form
 # the same hierarchy, so IntegrityError must be checked last).
 _CORE_ERROR_MAP: tuple[tuple[type[BaseException], type[IntegrityError]], ...] = (
@@ -101,11 +115,6 @@ def _translate_core_error(exc: BaseException) -> ManagerError | None:
     return None
 
 
-def _model_key(model_class: type[Model]) -> str:
-    """Return fully qualified identifier for a model."""
-    return f"{model_class.__module__}.{model_class.__qualname__}"
-
-
 @runtime_checkable
 class SupportsExecute(Protocol):
     """Protocol for objects that can execute queries."""
@@ -119,8 +128,8 @@ TQuery = TypeVar("TQuery", bound="Query")
 
 def _resolve_registered_model(model_key: str) -> type[Model]:
     """Resolve a model by its fully qualified key or simple class name."""
-    tables = registered_tables()
     # Try exact match first
+    tables = tables_view()
     model = tables.get(model_key)
     if model is not None:
         return model
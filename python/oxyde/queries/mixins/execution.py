@@ -7,20 +7,21 @@ Model.model_config - no sanitization needed.
 
 from __future__ import annotations
 
-from collections.abc import Coroutine
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Coroutine
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any
 
-from pydantic import TypeAdapter
 from typing_extensions import Self
 
 from oxyde._msgpack import msgpack
 from oxyde.core import ir
 from oxyde.exceptions import FieldLookupError, MultipleObjectsReturned, NotFoundError
-from oxyde.models.registry import registered_tables
+from oxyde.models.registry import tables_view
 from oxyde.queries.base import (
-    _TYPE_ADAPTER_CACHE,
-    _TYPE_ADAPTER_LOCK,
     SupportsExecute,
+    _list_adapter,
     _primary_key_meta,
     _resolve_execution_client,
     _resolve_registered_model,
@@ -39,6 +40,12 @@ def _remap_columns(columns: list[str], model_class: type[Model]) -> list[str]:
     return [rmap.get(c, c) for c in columns]
 
 
+def _distinct_values(objects: list[Any], attr: str) -> list[Any]:
+    """Non-null values of ``attr`` across ``objects``, first-seen order."""
+    values = (getattr(obj, attr, None) for obj in objects)
+    return list(dict.fromkeys(value for value in values if value is not None))
+
+
 class ExecutionMixin:
     """Mixin providing query execution capabilities."""
 
@@ -53,6 +60,8 @@ class ExecutionMixin:
     _offset_value: int | None
     _order_by_fields: list[tuple[str, str]]
     _group_by_fields: list[str]
+    _annotations: dict[str, Any]
+    _union_query: ExecutionMixin | None
     _exists: bool
 
     def _clone(self) -> Self:
@@ -75,30 +84,49 @@ class ExecutionMixin:
         """Must be implemented by JoiningMixin."""
         raise NotImplementedError
 
-    async def fetch_all(self, client: SupportsExecute) -> list[Any]:
-        """Execute query and return all results as dicts."""
+    async def _fetch_columnar(
+        self, client: SupportsExecute
+    ) -> tuple[list[str], list[list[Any]]]:
+        """Execute query and return field names and raw rows."""
         result_bytes = await self.fetch_msgpack(client)
         data = msgpack.unpackb(result_bytes, raw=False)
 
         # Columnar format from Rust: [columns, rows]
-        columns = _remap_columns(data[0], self.model_class)
-        rows = [dict(zip(columns, row)) for row in data[1]]
+        return _remap_columns(data[0], self.model_class), data[1]
 
-        if self._result_mode == "dict":
-            return rows
+    async def fetch_all(self, client: SupportsExecute) -> list[Any]:
+        """Execute query and return all results as dicts."""
+        columns, rows = await self._fetch_columnar(client)
         if self._result_mode == "list":
-            if not rows:
-                return []
-            fields = self._selected_fields or list(rows[0].keys())
-            if self._values_flat:
-                if len(fields) != 1:
-                    raise ValueError(
-                        "values_list(flat=True) requires exactly one field"
-                    )
-                column = fields[0]
-                return [row.get(column) for row in rows]
-            return [tuple(row.get(field) for field in fields) for row in rows]
-        return rows
+            return self._rows_to_tuples(columns, rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def _rows_to_tuples(self, columns: list[str], rows: list[list[Any]]) -> list[Any]:
+        """Shape columnar rows for values_list() without building per-row dicts."""
+        if not rows:
+            return []
+        fields = self._selected_fields or columns
+        # Requested field -> position in the row; missing fields yield None
+        positions = {column: index for index, column in enumerate(columns)}
+        indexes = [positions.get(field) for field in fields]
+        if self._values_flat:
+            if len(fields) != 1:
+                raise ValueError("values_list(flat=True) requires exactly one field")
+            index = indexes[0]
+            if index is None:
+                return [None] * len(rows)
+            return [row[index] for row in rows]
+        if indexes == list(range(len(columns))):
+            return [tuple(row) for row in rows]
+        if None not in indexes:
+            getter = itemgetter(*indexes)
+            if len(indexes) == 1:
+                return [(value,) for value in map(getter, rows)]
+            return list(map(getter, rows))
+        return [
+            tuple(None if index is None else row[index] for index in indexes)
+            for row in rows
+        ]
 
     async def _fetch_by_mode(self, client: SupportsExecute) -> list[Any]:
         """Fetch results honoring the values()/values_list() result mode.
@@ -148,14 +176,8 @@ class ExecutionMixin:
                 "Example: .group_by('field').values().all()"
             )
 
-        # Get or create cached TypeAdapter (thread-safe)
         model_class = self.model_class
-        if model_class not in _TYPE_ADAPTER_CACHE:
-            with _TYPE_ADAPTER_LOCK:
-                if model_class not in _TYPE_ADAPTER_CACHE:
-                    _TYPE_ADAPTER_CACHE[model_class] = TypeAdapter(list[model_class])  # type: ignore[valid-type]
-
-        adapter = _TYPE_ADAPTER_CACHE[model_class]
+        adapter = _list_adapter(model_class)
 
         result_bytes = await self.fetch_msgpack(client)
         data = msgpack.unpackb(result_bytes, raw=False, strict_map_key=False)
@@ -217,6 +239,41 @@ class ExecutionMixin:
         """
         return self._execute(using=using, client=client)
 
+    async def iterator(
+        self,
+        *,
+        using: str | None = None,
+        client: SupportsExecute | None = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over results one at a time.
+
+        The whole result is still fetched and decoded before the first row
+        is yielded. Only values() rows are built per item as they are
+        consumed; values_list() rows and model instances are built up front.
+        Also used by ``async for`` on the query (default connection).
+
+        Examples:
+            async for row in Product.objects.values("category").iterator():
+                print(row["category"])
+        """
+        if self._result_mode == "msgpack":
+            raise TypeError("iterator() is not supported in msgpack result mode")
+        exec_client = await _resolve_execution_client(using, client)
+        if self._result_mode == "dict":
+            columns, rows = await self._fetch_columnar(exec_client)
+            for row in rows:
+                yield dict(zip(columns, row))
+            return
+        if self._result_mode == "list":
+            results = await self.fetch_all(exec_client)
+        else:
+            results = await self.fetch_models(exec_client)
+        for item in results:
+            yield item
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.iterator()
+
     async def first(
         self,
         *,
@@ -301,6 +358,14 @@ class ExecutionMixin:
         clone = self._clone()
         clone._exists = True
         clone._limit_value = 1
+        # Existence does not depend on row order or on which columns are
+        # read: drop ORDER BY and probe only the primary key, unless the
+        # projection is shaped by GROUP BY/annotations or must match a UNION.
+        clone._order_by_fields = []
+        if not (clone._group_by_fields or clone._annotations or clone._union_query):
+            pk_field = clone.model_class._db_meta.pk_field
+            if pk_field is not None:
+                clone._selected_fields = [pk_field]
         query_ir = clone.to_ir()
 
         result_bytes = await exec_client.execute(query_ir)
@@ -415,45 +480,34 @@ class ExecutionMixin:
         if not models or not self._join_specs:
             return
 
-        # Sort specs by depth (shallow first) for nested joins
-        ordered_specs = sorted(
-            self._join_specs,
-            key=lambda spec: spec.path.count("__"),
-        )
-
-        # Build lookup: result_prefix → spec
-        spec_by_prefix: dict[str, _JoinDescriptor] = {
-            spec.result_prefix: spec for spec in ordered_specs
-        }
-
-        for prefix, rel_data in relations_map.items():
-            spec = spec_by_prefix.get(prefix)
-            if spec is None:
+        # _add_join_path appends a path's descriptors parent-first and never
+        # reorders, so specs are already shallow-before-nested
+        for spec in self._join_specs:
+            rel_data = relations_map.get(spec.result_prefix)
+            if rel_data is None:
                 continue
 
             columns = rel_data["columns"]
-            data = rel_data["data"]
-            refs = rel_data["refs"]
+            target_model = spec.target_model
 
             # Build pk → related instance cache
-            instance_cache: dict[Any, Model] = {}
-            for pk_val, row_values in data.items():
-                related_dict = dict(zip(columns, row_values))
-                instance_cache[pk_val] = spec.target_model(**related_dict)
-
-            # Assign to each model via refs
+            instance_cache: dict[Any, Model] = {
+                pk_val: target_model(**dict(zip(columns, row_values)))
+                for pk_val, row_values in rel_data["data"].items()
+            }
+
+            # Assign to each model via refs (a NULL ref never matches a pk)
+            attr_name = spec.attr_name
+            cached = instance_cache.get
+            refs = rel_data["refs"]
+            if not spec.parent_path:
+                for model, ref_pk in zip(models, refs):
+                    setattr(model, attr_name, cached(ref_pk))
+                continue
             for model, ref_pk in zip(models, refs):
                 parent = self._resolve_join_parent(model, spec.parent_path)
-                if parent is None:
-                    continue
-                if ref_pk is None:
-                    setattr(parent, spec.attr_name, None)
-                else:
-                    instance = instance_cache.get(ref_pk)
-                    if instance is not None:
-                        setattr(parent, spec.attr_name, instance)
-                    else:
-                        setattr(parent, spec.attr_name, None)
+                if parent is not None:
+                    setattr(parent, attr_name, cached(ref_pk))
 
     def _resolve_join_parent(
         self,
@@ -478,10 +532,40 @@ class ExecutionMixin:
         parents: list[Model],
         client: SupportsExecute,
     ) -> None:
-        """Run prefetch for all specified paths."""
+        """Run prefetch for all specified paths.
+
+        Paths starting at different relations touch disjoint attributes and
+        are fetched concurrently. Paths sharing a first relation (``posts``
+        and ``posts__comments``) overwrite the same attribute, so they stay
+        serial in the order they were requested. Inside a transaction every
+        group runs on the one transaction connection, so their queries are
+        serialized there anyway.
+
+        If a group fails, the others are cancelled and awaited before the
+        error propagates, so none keeps running against a transaction that
+        is being rolled back.
+        """
+        groups: dict[str, list[list[str]]] = {}
         for path in self._prefetch_paths:
             segments = path.split("__")
-            await self._prefetch_path(parents, client, segments, self.model_class)
+            groups.setdefault(segments[0], []).append(segments)
+
+        async def run_group(group: list[list[str]]) -> None:
+            for segments in group:
+                await self._prefetch_path(parents, client, segments, self.model_class)
+
+        if len(groups) == 1:
+            [group] = groups.values()
+            await run_group(group)
+            return
+        tasks = [asyncio.ensure_future(run_group(group)) for group in groups.values()]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def _prefetch_path(
         self,
@@ -529,19 +613,9 @@ class ExecutionMixin:
             )
         target_model = _resolve_registered_model(relation.target)
         parent_pk = _primary_key_meta(current_model)
-        parent_ids = [
-            getattr(parent, parent_pk.name)
-            for parent in parents
-            if getattr(parent, parent_pk.name, None) is not None
-        ]
-        unique_ids: list[Any] = []
-        seen: set[Any] = set()
-        for value in parent_ids:
-            if value not in seen:
-                seen.add(value)
-                unique_ids.append(value)
-
-        grouped: dict[Any, list[Model]] = {}
+        unique_ids = _distinct_values(parents, parent_pk.name)
+
+        grouped: defaultdict[Any, list[Model]] = defaultdict(list)
         if unique_ids:
             # Determine FK column: if remote_field is a virtual FK, use its db_column
             fk_meta = target_model._db_meta.field_metadata.get(relation.remote_field)
@@ -559,9 +633,8 @@ class ExecutionMixin:
             )
             for child in children:
                 key = getattr(child, fk_column, None)
-                if key is None:
-                    continue
-                grouped.setdefault(key, []).append(child)
+                if key is not None:
+                    grouped[key].append(child)
 
         descriptor = getattr(current_model, relation_name, None)
 
@@ -599,8 +672,7 @@ class ExecutionMixin:
 
         # Find through model in registry
         through_model: type[Model] | None = None
-        tables = registered_tables()
-        for key, model in tables.items():
+        for key, model in tables_view().items():
             if (
                 key.endswith(f".{relation.through}")
                 or model.__name__ == relation.through
@@ -636,33 +708,19 @@ class ExecutionMixin:
 
         # Collect parent IDs
         parent_pk = _primary_key_meta(source_model)
-        parent_ids = [
-            getattr(parent, parent_pk.name)
-            for parent in parents
-            if getattr(parent, parent_pk.name, None) is not None
-        ]
-        if not parent_ids:
+        unique_ids = _distinct_values(parents, parent_pk.name)
+        if not unique_ids:
             return
 
-        # Deduplicate
-        unique_ids: list[Any] = []
-        seen: set[Any] = set()
-        for value in parent_ids:
-            if value not in seen:
-                seen.add(value)
-                unique_ids.append(value)
-
         # Query through table for links
         # Use synthetic FK column names (e.g., "post_id", "tag_id") not relation names
         filter_kwargs = {f"{source_fk_column}__in": unique_ids}
-        links = await through_model.objects.filter(**filter_kwargs).all(client=client)
+        links: list[Model] = await through_model.objects.filter(**filter_kwargs).all(  # type: ignore[assignment]
+            client=client
+        )
 
         # Collect target IDs from links using FK column names
-        target_ids: list[Any] = []
-        for link in links:
-            target_id = getattr(link, target_fk_column, None)
-            if target_id is not None and target_id not in target_ids:
-                target_ids.append(target_id)
+        target_ids = _distinct_values(links, target_fk_column)
 
         # Query target model
         target_pk = _primary_key_meta(target_model)
@@ -679,12 +737,12 @@ class ExecutionMixin:
                 targets_by_pk[pk_val] = target
 
         # Group targets by source ID using FK column names
-        grouped: dict[Any, list[Model]] = {}
+        grouped: defaultdict[Any, list[Model]] = defaultdict(list)
         for link in links:
             source_id = getattr(link, source_fk_column, None)
             target_id = getattr(link, target_fk_column, None)
             if source_id is not None and target_id in targets_by_pk:
-                grouped.setdefault(source_id, []).append(targets_by_pk[target_id])
+                grouped[source_id].append(targets_by_pk[target_id])
 
         # Assign to parents
         descriptor = getattr(source_model, relation_name, None)
@@ -84,7 +84,11 @@ class JoiningMixin:
         return mappings
 
     def _add_join_path(self, path: str) -> None:
-        """Add join descriptors for a relation path."""
+        """Add join descriptors for a relation path.
+
+        Descriptors are appended parent-first, so ``_join_specs`` always lists
+        a join after the join it hangs off. Hydration relies on this order.
+        """
         descriptors = self._compute_join_descriptors(path)
         existing = {spec.path for spec in self._join_specs}
         for descriptor in descriptors:
@@ -12,7 +12,9 @@ from pydantic import TypeAdapter
 
 from oxyde._msgpack import msgpack
 from oxyde.core import ir
+from oxyde.db.pool import AsyncDatabase
 from oxyde.db.registry import get_connection
+from oxyde.db.transaction import AsyncTransaction
 from oxyde.exceptions import ManagerError
 from oxyde.models.serializers import (
     _dump_insert_data,
@@ -449,8 +451,11 @@ class MutationMixin:
             objects: Iterable of model instances or dicts
             using: Database alias
             client: Optional database client
-            batch_size: Optional batch size. If None, inserts all in one query.
+            batch_size: Optional batch size. If None, inserts all in one query
+                (a new one wherever the set of fields given changes from the
+                previous row; rows are always inserted in input order).
                 Use if hitting DB param limits (SQLite: 999, Postgres: 65535).
+                Multiple batches are inserted in a single transaction.
 
         Returns:
             List of created model instances
@@ -461,48 +466,71 @@ class MutationMixin:
 
         exec_client = await _resolve_execution_client(using, client)
 
-        # Determine batches: all at once or user-specified batch_size
         if batch_size is not None and batch_size <= 0:
             raise ValueError("batch_size must be a positive integer")
-        if batch_size is None:
-            batches = [instances]
+
+        # A multi-row INSERT binds the same columns for every row, so a new
+        # run starts wherever the set of fields changes: a column left out
+        # of a row keeps its database default instead of being bound as
+        # NULL, and rows still reach the database in input order.
+        runs: list[list[tuple[Model, dict[str, Any]]]] = []
+        run_columns: set[str] | None = None
+        for instance in instances:
+            payload = _dump_insert_data(instance)
+            if not payload:
+                raise ManagerError("bulk_create() encountered an empty payload")
+            if payload.keys() != run_columns:
+                runs.append([])
+                run_columns = set(payload)
+            runs[-1].append((instance, payload))
+
+        # Determine batches: each run at once or user-specified batch_size
+        batches: list[list[tuple[Model, dict[str, Any]]]] = []
+        for rows in runs:
+            step = batch_size or len(rows)
+            batches.extend(rows[i : i + step] for i in range(0, len(rows), step))
+
+        if len(batches) > 1 and isinstance(exec_client, AsyncDatabase):
+            # Several INSERTs: commit them together, all or nothing
+            async with AsyncTransaction(exec_client) as tx:
+                for batch in batches:
+                    await self._bulk_insert_batch(batch, tx)
         else:
-            batches = [
-                instances[i : i + batch_size]
-                for i in range(0, len(instances), batch_size)
-            ]
+            for batch in batches:
+                await self._bulk_insert_batch(batch, exec_client)
 
-        for batch in batches:
-            payloads = []
-            for instance in batch:
-                payload = _dump_insert_data(instance)
-                if not payload:
-                    raise ManagerError("bulk_create() encountered an empty payload")
-                payloads.append(payload)
+        return instances
 
-            query = InsertQuery(self.model_class).bulk_values(payloads)
-            result = await self._run_mutation(query, exec_client)
+    async def _bulk_insert_batch(
+        self,
+        rows: list[tuple[Model, dict[str, Any]]],
+        exec_client: SupportsExecute,
+    ) -> None:
+        """Insert rows sharing one column set with a single INSERT, assign PKs."""
+        batch = [instance for instance, _ in rows]
+        payloads = [payload for _, payload in rows]
 
-            # Assign auto-generated PKs to instances
-            inserted_ids = result.get("inserted_ids", [])
-            pk_field = self._primary_key_field()
+        query = InsertQuery(self.model_class).bulk_values(payloads)
+        result = await self._run_mutation(query, exec_client)
 
-            # Warn if ID count doesn't match (MySQL limitation)
-            if inserted_ids and len(inserted_ids) != len(batch):
-                warnings.warn(
-                    f"bulk_create: received {len(inserted_ids)} IDs for {len(batch)} rows. "
-                    "This may occur with MySQL when using ON DUPLICATE KEY, "
-                    "non-sequential auto_increment, or non-integer primary keys. "
-                    "Assigned IDs may be incorrect.",
-                    RuntimeWarning,
-                    stacklevel=2,
-                )
+        # Assign auto-generated PKs to instances
+        inserted_ids = result.get("inserted_ids", [])
+        pk_field = self._primary_key_field()
 
-            if pk_field and inserted_ids:
-                for instance, pk_value in zip(batch, inserted_ids):
-                    setattr(instance, pk_field, pk_value)
+        # Warn if ID count doesn't match (MySQL limitation)
+        if inserted_ids and len(inserted_ids) != len(batch):
+            warnings.warn(
+                f"bulk_create: received {len(inserted_ids)} IDs for {len(batch)} rows. "
+                "This may occur with MySQL when using ON DUPLICATE KEY, "
+                "non-sequential auto_increment, or non-integer primary keys. "
+                "Assigned IDs may be incorrect.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
 
-        return instances
+        if pk_field and inserted_ids:
+            for instance, pk_value in zip(batch, inserted_ids):
+                setattr(instance, pk_field, pk_value)
 
     async def bulk_update(
         self,
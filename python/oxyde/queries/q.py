@@ -60,6 +60,36 @@ from oxyde.models.lookups import (
 
 if TYPE_CHECKING:
     from oxyde.models.base import Model
+    from oxyde.models.metadata import ColumnMeta
+
+
+def _resolve_local_lookup(
+    model_class: type[Model], key: str
+) -> tuple[str, str, ColumnMeta] | None:
+    """Resolve a lookup key on the model's own fields, cached per model.
+
+    Resolution depends only on the key, not on the value, so a Q built
+    in a loop pays for parsing and validation once. Returns None for FK
+    paths (``user__age``), which are resolved on every call.
+    """
+    cache = model_class._db_meta.lookup_cache
+    resolved = cache.get(key)
+    if resolved is not None:
+        return resolved
+
+    field_path, lookup = _parse_lookup_path(key)
+    if len(field_path) != 1:
+        return None
+
+    field_name = field_path[0]
+    column_meta = _resolve_column_meta(model_class, field_name)
+    if lookup not in _allowed_lookups_for_meta(column_meta):
+        raise FieldLookupError(
+            f"Lookup '{lookup}' is not supported for field '{field_name}'"
+        )
+
+    resolved = cache[key] = (field_name, lookup, column_meta)
+    return resolved
 
 
 class Q:
@@ -73,6 +103,8 @@ class Q:
         Q(age__gte=18) & (Q(status="active") | Q(status="premium"))
     """
 
+    __slots__ = ("_node", "_kwargs", "_op", "_children")
+
     _node: FilterNode | None
     _kwargs: dict[str, Any]
     _op: str | None
@@ -134,18 +166,11 @@ class Q:
         conditions: list[FilterNode] = []
 
         for key, value in self._kwargs.items():
-            field_path, lookup = _parse_lookup_path(key)
+            local = _resolve_local_lookup(model_class, key)
 
             # Single field (no FK traversal)
-            if len(field_path) == 1:
-                field_name = field_path[0]
-                column_meta = _resolve_column_meta(model_class, field_name)
-
-                if lookup not in _allowed_lookups_for_meta(column_meta):
-                    raise FieldLookupError(
-                        f"Lookup '{lookup}' is not supported for field '{field_name}'"
-                    )
-
+            if local is not None:
+                field_name, lookup, column_meta = local
                 field_conditions = _build_lookup_conditions(
                     model_class,
                     field_name,
@@ -156,6 +181,7 @@ class Q:
                 conditions.extend([c.to_ir() for c in field_conditions])
             else:
                 # FK traversal (e.g., user__age__gte)
+                field_path, lookup = _parse_lookup_path(key)
                 resolved = _resolve_field_path(model_class, field_path)
 
                 if lookup not in _allowed_lookups_for_meta(resolved.column_meta):
@@ -195,18 +221,30 @@ class Q:
         """Combine with AND logic: Q(...) & Q(...)"""
         if not isinstance(other, Q):
             raise TypeError(f"Cannot AND Q with {type(other)}")
-        result = Q()
-        result._op = "and"
-        result._children = [self, other]
-        return result
+        return self._combine("and", other)
 
     def __or__(self, other: Q) -> Q:
         """Combine with OR logic: Q(...) | Q(...)"""
         if not isinstance(other, Q):
             raise TypeError(f"Cannot OR Q with {type(other)}")
+        return self._combine("or", other)
+
+    def _combine(self, op: str, other: Q) -> Q:
+        """Join two Q's under ``op``, flattening same-op operands.
+
+        ``a & b & c`` becomes one AND over three children instead of a
+        left-leaning chain, so conversion yields a single flat IR node.
+        Operands are never mutated; the children lists are copied.
+        """
+        children: list[Q] = []
+        for operand in (self, other):
+            if operand._op == op:
+                children.extend(operand._children)
+            else:
+                children.append(operand)
         result = Q()
-        result._op = "or"
-        result._children = [self, other]
+        result._op = op
+        result._children = children
         return result
 
     def __invert__(self) -> Q:
@@ -232,8 +270,8 @@ class Q:
             FilterNode dict or None if empty
         """
         # Check if this is a combined Q with operations
-        op = getattr(self, "_op", None)
-        children = getattr(self, "_children", None)
+        op = self._op
+        children = self._children
 
         if op and children:
             # Recursively resolve children
@@ -264,9 +302,9 @@ class Q:
         return self._ensure_node(model_class, query)
 
     def __repr__(self) -> str:
-        op = getattr(self, "_op", None)
+        op = self._op
         if op:
-            children = getattr(self, "_children", [])
+            children = self._children
             if op == "not":
                 return f"~{children[0]!r}"
             else:
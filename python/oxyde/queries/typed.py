@@ -18,7 +18,7 @@ from oxyde.models.base import Model
 from oxyde.queries.select import Query
 
 if TYPE_CHECKING:
-    from collections.abc import Coroutine
+    from collections.abc import AsyncIterator, Coroutine
     from typing import Literal, overload
 
     from oxyde.queries.base import SupportsExecute
@@ -55,6 +55,15 @@ class ValuesQuery(Query[TModel]):
             client: SupportsExecute | None = None,
         ) -> Coroutine[Any, Any, list[dict[str, Any]]]: ...
 
+        def iterator(
+            self,
+            *,
+            using: str | None = None,
+            client: SupportsExecute | None = None,
+        ) -> AsyncIterator[dict[str, Any]]: ...
+
+        def __aiter__(self) -> AsyncIterator[dict[str, Any]]: ...
+
         async def first(
             self,
             *,
@@ -117,6 +126,15 @@ class ValuesListQuery(Query[TModel]):
             client: SupportsExecute | None = None,
         ) -> Coroutine[Any, Any, list[tuple[Any, ...]]]: ...
 
+        def iterator(
+            self,
+            *,
+            using: str | None = None,
+            client: SupportsExecute | None = None,
+        ) -> AsyncIterator[tuple[Any, ...]]: ...
+
+        def __aiter__(self) -> AsyncIterator[tuple[Any, ...]]: ...
+
         async def first(
             self,
             *,
@@ -1,6 +1,7 @@
 """Shared test helpers — stubs, factories, utilities."""
 from __future__ import annotations
 
+from collections import deque
 from typing import Any
 
 import msgpack
@@ -19,12 +20,12 @@ class StubExecuteClient:
     """
 
     def __init__(self, payloads: list[Any]):
-        self.payloads = list(payloads)
+        self.payloads = deque(payloads)
         self.calls: list[dict[str, Any]] = []
 
     async def execute(self, ir: dict[str, Any]) -> bytes:
         self.calls.append(ir)
         if not self.payloads:
             raise RuntimeError("stub payloads exhausted")
-        payload = self.payloads.pop(0)
+        payload = self.payloads.popleft()
         return payload if isinstance(payload, bytes) else msgpack.packb(payload)
@@ -4,6 +4,7 @@ from __future__ import annotations
 import pytest
 
 from oxyde import execute_raw
+from oxyde.exceptions import IntegrityError
 
 from .conftest import Author, Post, Tag, create_tag
 
@@ -66,6 +67,18 @@ class TestLargeBatch:
         count = await Tag.objects.count(using=db.name)
         assert count == 53  # 3 seed + 50 new
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_batches_are_atomic(self, db):
+        """A failing batch rolls back the batches inserted before it."""
+        tags = [Tag(name=f"atomic_tag_{i}") for i in range(15)]
+        tags.append(Tag(name="atomic_tag_0"))  # duplicate in the last batch
+
+        with pytest.raises(IntegrityError):
+            await Tag.objects.bulk_create(tags, batch_size=10, using=db.name)
+
+        count = await Tag.objects.count(using=db.name)
+        assert count == 3  # seed rows only
+
 
 class TestUnion:
     @pytest.mark.asyncio
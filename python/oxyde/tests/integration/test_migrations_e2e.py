@@ -22,6 +22,9 @@ from oxyde.migrations import (
     apply_migrations,
     extract_current_schema,
     generate_migration_file,
+    get_applied_migrations,
+    get_applied_migrations_among,
+    record_migrations,
     rollback_migrations,
 )
 from oxyde.migrations.utils import detect_dialect
@@ -387,6 +390,74 @@ class TestDropForeignKeyBugRegressionE2E:
         assert await _column_exists(database.name, books, "author_id", dialect)
 
 
+class TestFakeApplyE2E:
+    @pytest.mark.asyncio
+    async def test_fake_apply_records_all_without_executing(self, empty_db, tmp_path):
+        database, dialect = empty_db
+        suffix = uuid.uuid4().hex[:8]
+        tbl = f"users_{suffix}"
+
+        class UserV1(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            email: str = Field(max_length=255)
+
+            class Meta:
+                is_table = True
+                table_name = tbl
+
+        class UserV2(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            email: str = Field(max_length=255)
+            nickname: str | None = Field(
+                default=None, db_nullable=True, max_length=100
+            )
+
+            class Meta:
+                is_table = True
+                table_name = tbl
+
+        first = _write_migration(tmp_path, [], [UserV1], dialect, f"create_{suffix}")
+        second = _write_migration(
+            tmp_path, [UserV1], [UserV2], dialect, f"add_nick_{suffix}"
+        )
+
+        applied = await apply_migrations(
+            migrations_dir=str(tmp_path), db_alias=database.name, fake=True
+        )
+
+        assert applied == [first.stem, second.stem]
+        assert await get_applied_migrations(database.name) == applied
+        assert not await _table_exists(database.name, tbl, dialect)
+
+
+class TestMigrationsTableE2E:
+    @pytest.mark.asyncio
+    async def test_applied_among_filters_in_database(self, empty_db):
+        database, _ = empty_db
+        first, second, third, unapplied = (
+            f"000{i}_{uuid.uuid4().hex[:8]}" for i in range(1, 5)
+        )
+        await record_migrations([first, second, third], database.name)
+
+        assert await get_applied_migrations_among(
+            [third, first, unapplied], database.name
+        ) == [first, third]
+        assert await get_applied_migrations_among([], database.name) == []
+
+    @pytest.mark.asyncio
+    async def test_applied_among_many_names(self, empty_db):
+        database, _ = empty_db
+        first, second = (f"000{i}_{uuid.uuid4().hex[:8]}" for i in range(1, 3))
+        await record_migrations([first, second], database.name)
+
+        on_disk = [f"9{i:04d}_unapplied" for i in range(1500)] + [second, first]
+
+        assert await get_applied_migrations_among(on_disk, database.name) == [
+            first,
+            second,
+        ]
+
+
 class TestUpgradeDowngradeSymmetryE2E:
     @pytest.mark.asyncio
     async def test_rollback_restores_state(self, empty_db, tmp_path):
@@ -67,3 +67,20 @@ class TestPrefetch:
 
         quantum = posts[2]
         assert {t.name for t in quantum.tags} == {"SQL"}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_sibling_relations(self, db):
+        """Independent prefetch paths are all populated."""
+        posts = await (
+            Post.objects.filter(id__in=[1, 2])
+            .prefetch("comments", "tags")
+            .order_by("id")
+            .all(using=db.name)
+        )
+        assert len(posts) == 2
+        assert {c.body for c in posts[0].comments} == {
+            "Great read!",
+            "Thanks for sharing",
+        }
+        assert {t.name for t in posts[0].tags} == {"Python", "Rust"}
+        assert {t.name for t in posts[1].tags} == {"Python"}
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import msgpack
 import pytest
 
 from oxyde import Field, Model
+from oxyde.core import render_sql_debug
 from oxyde.queries.aggregates import (
     Aggregate,
     Avg,
@@ -16,8 +18,6 @@ from oxyde.queries.aggregates import (
     RawSQL,
     Sum,
 )
-
-
 from oxyde.tests.helpers import StubExecuteClient
 
 
@@ -278,41 +278,71 @@ class TestManagerAggregates:
         assert count == 3
 
     @pytest.mark.asyncio
-    async def test_manager_sum(self):
-        """Test manager.sum() method."""
-        stub = StubExecuteClient([(["__sum__"], [[150.0]])])
-
-        total = await Product.objects.sum("price", client=stub)
-
-        # Result depends on implementation
-        assert stub.calls[0]["aggregates"][0]["op"] == "sum"
-
-    @pytest.mark.asyncio
-    async def test_manager_avg(self):
-        """Test manager.avg() method."""
-        stub = StubExecuteClient([(["__avg__"], [[4.5]])])
+    async def test_count_strips_ordering_and_pagination(self):
+        """Test count() emits a bare COUNT(*) with the WHERE clause only."""
+        stub = StubExecuteClient([(["_count"], [[2]])])
+
+        await (
+            Product.objects.filter(price__gt=10)
+            .order_by("-price")
+            .limit(5)
+            .offset(5)
+            .count(client=stub)
+        )
 
-        avg = await Product.objects.avg("rating", client=stub)
+        query_ir = stub.calls[0]
+        assert query_ir["count"] is True
+        assert "order_by" not in query_ir
+        assert "limit" not in query_ir
+        assert "offset" not in query_ir
 
-        assert stub.calls[0]["aggregates"][0]["op"] == "avg"
+        sql, params = render_sql_debug(msgpack.packb(query_ir), "sqlite", False)
+        assert sql == 'SELECT COUNT(*) AS "_count" FROM "product" WHERE "price" > ?'
+        assert params == [10]
 
     @pytest.mark.asyncio
-    async def test_manager_max(self):
-        """Test manager.max() method."""
-        stub = StubExecuteClient([(["__max__"], [[99.99]])])
+    async def test_exists_probes_primary_key_without_ordering(self):
+        """Test exists() selects only the PK, drops ORDER BY, keeps LIMIT 1."""
+        stub = StubExecuteClient([(["exists"], [[1]])])
 
-        max_val = await Product.objects.max("price", client=stub)
+        found = await (
+            Product.objects.filter(price__gt=10).order_by("-price").exists(client=stub)
+        )
 
-        assert stub.calls[0]["aggregates"][0]["op"] == "max"
+        assert found is True
+        query_ir = stub.calls[0]
+        assert query_ir["exists"] is True
+        assert query_ir["cols"] == ["id"]
+        assert query_ir["limit"] == 1
+        assert "order_by" not in query_ir
+
+        sql, params = render_sql_debug(msgpack.packb(query_ir), "sqlite", False)
+        assert sql == (
+            'SELECT EXISTS(SELECT "product"."id" AS "id" FROM "product" '
+            'WHERE "price" > ? LIMIT ?)'
+        )
+        assert params == [10, 1]
 
     @pytest.mark.asyncio
-    async def test_manager_min(self):
-        """Test manager.min() method."""
-        stub = StubExecuteClient([(["__min__"], [[0.99]])])
-
-        min_val = await Product.objects.min("price", client=stub)
-
-        assert stub.calls[0]["aggregates"][0]["op"] == "min"
+    @pytest.mark.parametrize(
+        "method,field,result_key,value",
+        [
+            ("sum", "price", "_sum", 150.0),
+            ("avg", "rating", "_avg", 4.5),
+            ("max", "price", "_max", 99.99),
+            ("min", "price", "_min", 0.99),
+        ],
+    )
+    async def test_manager_aggregate(self, method, field, result_key, value):
+        """Test manager.sum()/avg()/max()/min() methods."""
+        stub = StubExecuteClient([([result_key], [[value]])])
+
+        result = await getattr(Product.objects, method)(field, client=stub)
+
+        assert result == value
+        aggregate = stub.calls[0]["aggregates"][0]
+        assert aggregate["op"] == method
+        assert aggregate["field"] == field
 
 
 class TestAggregatesWithFilters:
@@ -9,12 +9,13 @@ real-world behavior. Tests that require lazy annotations define models
 inside exec() with the future import.
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
 import pytest
 
 from oxyde import Field, Model
 from oxyde.models.registry import registered_tables
+from oxyde.models.utils import _unpack_annotated, _unwrap_optional
 
 
 # ─── FK: direct type (Author defined above) ──────────────────────────
@@ -117,6 +118,7 @@ class TestFKFutureAnnotations:
 from __future__ import annotations
 from oxyde import Field, Model
 from oxyde.models.registry import registered_tables
+from oxyde.models.utils import _unpack_annotated, _unwrap_optional
 
 class FutAuthor(Model):
     id: int | None = Field(default=None, db_pk=True)
@@ -153,6 +155,7 @@ class TestFKSelfReferential:
 from __future__ import annotations
 from oxyde import Field, Model
 from oxyde.models.registry import registered_tables
+from oxyde.models.utils import _unpack_annotated, _unwrap_optional
 
 class SelfRefCategory(Model):
     id: int | None = Field(default=None, db_pk=True)
@@ -172,6 +175,51 @@ result_fk = SelfRefCategory._db_meta.field_metadata["parent"].foreign_key
         assert ns["result_fk"].column_name == "parent_id"
 
 
+# ─── FK: forward ref retried only once its target is defined ─────────
+
+
+class TestFKForwardRefRetry:
+    def test_pending_model_waits_for_target(self, monkeypatch):
+        from oxyde.models import registry
+
+        attempts = []
+        original = registry._finalize_model
+
+        def counting_finalize(model):
+            attempts.append(model.__name__)
+            return original(model)
+
+        monkeypatch.setattr(registry, "_finalize_model", counting_finalize)
+        ns = {}
+        exec(
+            """
+from __future__ import annotations
+from oxyde import Field, Model
+
+class WaitBook(Model):
+    id: int | None = Field(default=None, db_pk=True)
+    author: WaitAuthor | None = Field(default=None, db_on_delete="CASCADE")
+    class Meta:
+        is_table = True
+
+class WaitUnrelated(Model):
+    id: int | None = Field(default=None, db_pk=True)
+    class Meta:
+        is_table = True
+
+class WaitAuthor(Model):
+    id: int | None = Field(default=None, db_pk=True)
+    class Meta:
+        is_table = True
+""",
+            ns,
+        )
+        # Tried at its own definition, skipped for WaitUnrelated, then
+        # finalized once WaitAuthor exists.
+        assert attempts.count("WaitBook") == 2
+        assert "author_id" in ns["WaitBook"].model_fields
+
+
 # ─── Reverse FK: list[Post] (direct type, defined above) ─────────────
 
 
@@ -236,6 +284,7 @@ class TestReverseFKFutureAnnotations:
 from __future__ import annotations
 from oxyde import Field, Model
 from oxyde.models.registry import registered_tables
+from oxyde.models.utils import _unpack_annotated, _unwrap_optional
 
 class FutRevAuthor(Model):
     id: int | None = Field(default=None, db_pk=True)
@@ -257,3 +306,24 @@ result_fields = list(FutRevAuthor.model_fields.keys())
             ns,
         )
         assert "posts" in ns["result_fields"]
+
+
+# ─── Type hint helpers ───────────────────────────────────────────────
+
+
+class TestTypeHintHelpers:
+    """_unpack_annotated/_unwrap_optional cache by hint."""
+
+    def test_cached_results_are_stable(self):
+        hint = Annotated[int | None, "meta"]
+        first = _unpack_annotated(hint)
+        assert first == (int | None, ("meta",))
+        assert _unpack_annotated(hint) is first
+        assert _unwrap_optional(first[0]) == (int, True)
+        assert _unwrap_optional(str) == (str, False)
+
+    def test_unhashable_hint_bypasses_cache(self):
+        hint = Annotated[str | None, {"unhashable": True}]
+        base, metadata = _unpack_annotated(hint)
+        assert metadata == ({"unhashable": True},)
+        assert _unwrap_optional(base) == (str, True)
@@ -14,6 +14,18 @@ _reg_module = importlib.import_module("oxyde.db.registry")
 
 
 class StubCore:
+    # Fixed attribute set: a mistyped call-log name fails loudly
+    __slots__ = (
+        "init_calls",
+        "close_calls",
+        "close_all_called",
+        "begin_calls",
+        "commit_calls",
+        "rollback_calls",
+        "execute_in_tx_calls",
+        "tx_counter",
+    )
+
     def __init__(self) -> None:
         self.init_calls: list[tuple[str, str, dict | None]] = []
         self.close_calls: list[str] = []
@@ -58,25 +70,32 @@ class StubCore:
         return "sqlite"
 
 
-@pytest.mark.asyncio
-async def test_register_and_retrieve_connection(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+@pytest.fixture
+def stub_core(monkeypatch: pytest.MonkeyPatch) -> StubCore:
+    """Route the pool/transaction core calls to a StubCore, no registered DBs."""
     stub = StubCore()
-    monkeypatch.setattr(_reg_module, "_CONNECTIONS", {})
-    monkeypatch.setattr(_pool_module, "_init_pool", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "_init_pool_overwrite", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "close_pool", stub.close_pool)
-    monkeypatch.setattr(_pool_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_reg_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_pool_module, "_execute", stub.execute)
-    monkeypatch.setattr(_pool_module, "_pool_backend", stub.pool_backend)
-    monkeypatch.setattr(
-        _tx_module, "_execute_in_transaction", stub.execute_in_transaction
+    patches = (
+        (_pool_module, "_init_pool", stub.init_pool),
+        (_pool_module, "_init_pool_overwrite", stub.init_pool),
+        (_pool_module, "close_pool", stub.close_pool),
+        (_pool_module, "close_all_pools", stub.close_all_pools),
+        (_reg_module, "close_all_pools", stub.close_all_pools),
+        (_pool_module, "_execute", stub.execute),
+        (_pool_module, "_pool_backend", stub.pool_backend),
+        (_tx_module, "_execute_in_transaction", stub.execute_in_transaction),
+        (_tx_module, "_begin_transaction", stub.begin_transaction),
+        (_tx_module, "_commit_transaction", stub.commit_transaction),
+        (_tx_module, "_rollback_transaction", stub.rollback_transaction),
+        (_reg_module, "_CONNECTIONS", {}),
     )
-    monkeypatch.setattr(_tx_module, "_begin_transaction", stub.begin_transaction)
-    monkeypatch.setattr(_tx_module, "_commit_transaction", stub.commit_transaction)
-    monkeypatch.setattr(_tx_module, "_rollback_transaction", stub.rollback_transaction)
+    for module, name, value in patches:
+        monkeypatch.setattr(module, name, value)
+    return stub
+
+
+@pytest.mark.asyncio
+async def test_register_and_retrieve_connection(stub_core: StubCore) -> None:
+    stub = stub_core
 
     db = AsyncDatabase(
         "sqlite::memory:",
@@ -103,6 +122,7 @@ async def test_register_and_retrieve_connection(
                 "sqlite_synchronous": "NORMAL",
                 "sqlite_cache_size": 10000,
                 "sqlite_busy_timeout": 5000,
+                "sqlite_temp_store": "MEMORY",
             },
         )
     ]
@@ -116,24 +136,8 @@ async def test_register_and_retrieve_connection(
 
 
 @pytest.mark.asyncio
-async def test_transaction_context(monkeypatch: pytest.MonkeyPatch) -> None:
-    stub = StubCore()
-    monkeypatch.setattr(_pool_module, "_init_pool", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "_init_pool_overwrite", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "close_pool", stub.close_pool)
-    monkeypatch.setattr(_pool_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_reg_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_pool_module, "_execute", stub.execute)
-    monkeypatch.setattr(_pool_module, "_pool_backend", stub.pool_backend)
-    monkeypatch.setattr(
-        _tx_module, "_execute_in_transaction", stub.execute_in_transaction
-    )
-    monkeypatch.setattr(_tx_module, "_begin_transaction", stub.begin_transaction)
-    monkeypatch.setattr(_tx_module, "_commit_transaction", stub.commit_transaction)
-    monkeypatch.setattr(_tx_module, "_rollback_transaction", stub.rollback_transaction)
-
-    # Clear connections after setting up monkeypatch
-    monkeypatch.setattr(_reg_module, "_CONNECTIONS", {})
+async def test_transaction_context(stub_core: StubCore) -> None:
+    stub = stub_core
 
     db = AsyncDatabase(
         "sqlite::memory:",
@@ -165,8 +169,10 @@ async def test_transaction_context(monkeypatch: pytest.MonkeyPatch) -> None:
 
 
 @pytest.mark.asyncio
-async def test_transaction_timeout_rolls_back(monkeypatch: pytest.MonkeyPatch) -> None:
-    stub = StubCore()
+async def test_transaction_timeout_rolls_back(
+    stub_core: StubCore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stub = stub_core
 
     async def slow_execute_in_transaction(
         pool_name: str, tx_id: int, ir_bytes: bytes
@@ -175,22 +181,9 @@ async def test_transaction_timeout_rolls_back(monkeypatch: pytest.MonkeyPatch) -
         stub.execute_in_tx_calls.append((tx_id, ir_bytes))
         return b"{}"
 
-    monkeypatch.setattr(_pool_module, "_init_pool", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "_init_pool_overwrite", stub.init_pool)
-    monkeypatch.setattr(_pool_module, "close_pool", stub.close_pool)
-    monkeypatch.setattr(_pool_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_reg_module, "close_all_pools", stub.close_all_pools)
-    monkeypatch.setattr(_pool_module, "_execute", stub.execute)
-    monkeypatch.setattr(_pool_module, "_pool_backend", stub.pool_backend)
     monkeypatch.setattr(
         _tx_module, "_execute_in_transaction", slow_execute_in_transaction
     )
-    monkeypatch.setattr(_tx_module, "_begin_transaction", stub.begin_transaction)
-    monkeypatch.setattr(_tx_module, "_commit_transaction", stub.commit_transaction)
-    monkeypatch.setattr(_tx_module, "_rollback_transaction", stub.rollback_transaction)
-
-    # Clear connections after setting up monkeypatch
-    monkeypatch.setattr(_reg_module, "_CONNECTIONS", {})
 
     db = AsyncDatabase(
         "sqlite::memory:",
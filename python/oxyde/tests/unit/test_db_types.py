@@ -15,7 +15,7 @@ from uuid import UUID
 import pytest
 
 from oxyde import Field, Model
-from oxyde.models.registry import clear_registry
+from oxyde.models.registry import _PENDING_QUEUE, clear_registry
 
 
 class Status(Enum):
@@ -219,6 +219,9 @@ class TestColTypes:
                     class Meta:
                         is_table = True
                         table_name = "int_enum_tasks"
+
+            # Still queued for retry, not dropped by the failed attempt.
+            assert [m.__name__ for m in _PENDING_QUEUE] == ["Task"]
         finally:
             # The failed Task stays in _PENDING_MODELS otherwise and re-raises
             # on the next model finalization in an unrelated test.
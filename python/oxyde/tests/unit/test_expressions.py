@@ -352,6 +352,19 @@ class TestQAndComposition:
 
         assert node is not None
         assert node["type"] == "and"
+        # Chained ANDs flatten into one node
+        assert len(node["conditions"]) == 3
+        assert all(c["type"] == "condition" for c in node["conditions"])
+
+    def test_and_does_not_mutate_operands(self):
+        """Flattening copies children instead of extending an operand."""
+        base = Q(name="test") & Q(age__gte=18)
+        first = base & Q(is_active=True)
+        second = base & Q(balance=0)
+
+        assert len(base._children) == 2
+        assert first._children[:2] == base._children
+        assert second._children[2] is not first._children[2]
 
     def test_q_and_with_empty(self):
         """Test Q() & Q() where one is empty."""
@@ -384,6 +397,7 @@ class TestQOrComposition:
 
         assert node is not None
         assert node["type"] == "or"
+        assert len(node["conditions"]) == 3
 
 
 class TestQNotComposition:
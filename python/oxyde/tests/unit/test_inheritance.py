@@ -34,6 +34,24 @@ class TestBasicInheritance:
         assert base_key in tables
         assert create_key not in tables
 
+    def test_subclass_gets_own_model_key(self):
+        """Test that the cached registry key is not inherited."""
+
+        class KeyedParent(Model):
+            id: int | None = Field(default=None, db_pk=True)
+
+            class Meta:
+                is_table = True
+
+        class KeyedChild(KeyedParent):
+            class Meta:
+                is_table = True
+
+        tables = registered_tables()
+
+        assert tables[f"{__name__}.{KeyedParent.__qualname__}"] is KeyedParent
+        assert tables[f"{__name__}.{KeyedChild.__qualname__}"] is KeyedChild
+
     def test_explicit_non_table_subclass(self):
         """Test subclass with explicit is_table=False."""
 
@@ -578,3 +578,30 @@ class TestResolveColumnMeta:
 
         with pytest.raises(FieldError):
             _resolve_column_meta(OxydeTestModel, "nonexistent")
+
+
+class TestLookupCache:
+    """Test per-model caching of resolved lookup keys."""
+
+    def test_cached_lookup_binds_each_value(self):
+        """Test a cached key still produces the value of each filter call."""
+        registered_tables()
+
+        first = get_filter_condition(OxydeTestModel.objects.filter(age__gte=18).to_ir())
+        second = get_filter_condition(
+            OxydeTestModel.objects.filter(age__gte=65).to_ir()
+        )
+
+        assert "age__gte" in OxydeTestModel._db_meta.lookup_cache
+        assert (first["operator"], first["value"]) == (">=", 18)
+        assert (second["operator"], second["value"]) == (">=", 65)
+
+    def test_invalid_lookup_is_not_cached(self):
+        """Test a rejected key raises on every call."""
+        registered_tables()
+
+        for _ in range(2):
+            with pytest.raises(FieldLookupError):
+                OxydeTestModel.objects.filter(age__contains="18")
+
+        assert "age__contains" not in OxydeTestModel._db_meta.lookup_cache
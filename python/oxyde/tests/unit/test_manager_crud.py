@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import msgpack
 import pytest
 from pydantic import computed_field
 
-from oxyde import Field, Model
+from oxyde import F, Field, Model
+from oxyde.core import render_sql_debug
 from oxyde.exceptions import (
     FieldError,
     IntegrityError,
@@ -322,6 +324,98 @@ class TestManagerBulkCreate:
 
         assert len(created) == 2
 
+    @pytest.mark.asyncio
+    async def test_bulk_create_single_insert_returns_pks(self):
+        """Test all rows go in one INSERT and PKs come back in row order."""
+        stub = StubExecuteClient([{"affected": 3, "inserted_ids": [7, 8, 9]}])
+
+        objects = [{"name": f"User{i}", "age": 20 + i} for i in range(3)]
+        created = await OxydeTestModel.objects.bulk_create(objects, client=stub)
+
+        assert len(stub.calls) == 1
+        assert len(stub.calls[0]["bulk_values"]) == 3
+        assert [obj.id for obj in created] == [7, 8, 9]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_splits_where_columns_change(self):
+        """Test a new INSERT starts only where the set of fields changes."""
+        stub = StubExecuteClient(
+            [
+                {"affected": 2, "inserted_ids": [1, 2]},
+                {"affected": 1, "inserted_ids": [3]},
+                {"affected": 1, "inserted_ids": [4]},
+            ]
+        )
+
+        objects = [
+            {"name": "Default", "age": 20},
+            {"name": "Other", "age": 40},
+            {"name": "Inactive", "age": 30, "is_active": False},
+            {"name": "Last", "age": 50},
+        ]
+        created = await OxydeTestModel.objects.bulk_create(objects, client=stub)
+
+        assert [len(call["bulk_values"]) for call in stub.calls] == [2, 1, 1]
+        assert stub.calls[1]["bulk_values"][0]["is_active"] is False
+        assert "is_active" not in stub.calls[2]["bulk_values"][0]
+        assert [obj.id for obj in created] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_mixed_payloads_keep_input_order(self):
+        """Test auto-increment PKs follow input order across column sets."""
+
+        class AutoIncrementClient:
+            def __init__(self):
+                self.next_id = 1
+                self.names: list[str] = []
+
+            async def execute(self, ir):
+                rows = ir["bulk_values"]
+                self.names.extend(row["name"] for row in rows)
+                ids = list(range(self.next_id, self.next_id + len(rows)))
+                self.next_id += len(rows)
+                return msgpack.packb({"affected": len(rows), "inserted_ids": ids})
+
+        client = AutoIncrementClient()
+        objects = [
+            {"name": "a", "age": 1, "email": "a@example.com"},
+            {"name": "b", "age": 2},
+            {"name": "c", "age": 3, "email": "c@example.com"},
+            {"name": "d", "age": 4},
+        ]
+        created = await OxydeTestModel.objects.bulk_create(
+            objects, client=client, batch_size=10
+        )
+
+        assert client.names == ["a", "b", "c", "d"]
+        assert [obj.id for obj in created] == [1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_leaves_db_default_for_unset_fields(self):
+        """Test a field unset on one row is not bound as NULL for it."""
+
+        class Event(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            name: str
+            created_at: str | None = Field(default=None, db_default="'server'")
+
+            class Meta:
+                is_table = True
+
+        stub = StubExecuteClient(
+            [
+                {"affected": 1, "inserted_ids": [1]},
+                {"affected": 1, "inserted_ids": [2]},
+            ]
+        )
+
+        await Event.objects.bulk_create(
+            [Event(name="a"), Event(name="b", created_at="explicit")], client=stub
+        )
+
+        rows = [call["bulk_values"] for call in stub.calls]
+        assert rows == [[{"name": "a"}], [{"name": "b", "created_at": "explicit"}]]
+
     @pytest.mark.asyncio
     async def test_bulk_create_empty_list(self):
         """Test bulk_create() with empty list returns empty."""
@@ -520,6 +614,32 @@ class TestManagerDelete:
         assert affected == 5
         assert stub.calls[0]["op"] == "delete"
 
+    @pytest.mark.asyncio
+    async def test_filter_delete_is_single_statement(self):
+        """Test delete() pushes the filter into one DELETE, no PK prefetch."""
+        stub = StubExecuteClient([{"affected": 2}])
+
+        await OxydeTestModel.objects.filter(age__gt=30).delete(client=stub)
+
+        assert len(stub.calls) == 1
+        assert stub.calls[0]["op"] == "delete"
+        assert stub.calls[0]["filter_tree"] == {
+            "type": "condition",
+            "field": "age",
+            "operator": ">",
+            "value": 30,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_delete_has_no_where(self):
+        """Test filter().delete() without predicates emits a bare DELETE."""
+        stub = StubExecuteClient([{"affected": 7}])
+
+        await OxydeTestModel.objects.filter().delete(client=stub)
+
+        assert len(stub.calls) == 1
+        assert "filter_tree" not in stub.calls[0]
+
 
 class TestManagerUpdate:
     """Test QueryManager.update() method."""
@@ -537,6 +657,27 @@ class TestManagerUpdate:
         assert result == 3
         assert stub.calls[0]["op"] == "update"
 
+    @pytest.mark.asyncio
+    async def test_f_expression_update_is_single_statement(self):
+        """Test update() with F() compiles to one UPDATE, no read-modify-write."""
+        stub = StubExecuteClient([{"affected": 4}])
+
+        await OxydeTestModel.objects.filter(is_active=True).update(
+            age=F("age") + 1, client=stub
+        )
+
+        assert len(stub.calls) == 1
+        call = stub.calls[0]
+        assert call["op"] == "update"
+        assert call["values"]["age"]["__expr__"]["op"] == "add"
+        assert call["filter_tree"]["field"] == "is_active"
+
+        sql, params = render_sql_debug(msgpack.packb(call), "sqlite", False)
+        assert sql == (
+            'UPDATE "oxydetestmodel" SET "age" = "age" + ? WHERE "is_active" = ?'
+        )
+        assert params == [1, True]
+
 
 class TestManagerFirstLast:
     """Test QueryManager.first() and last() methods."""
@@ -9,15 +9,18 @@ Tests cover:
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
+from oxyde._msgpack import msgpack
 from oxyde.migrations.context import MigrationContext
 from oxyde.migrations.executor import _check_migration_dependency, _check_rollback_dependency
 from oxyde.migrations.generator import generate_migration_file
 from oxyde.migrations.replay import SchemaState, _topological_sort_migrations, replay_migrations
 from oxyde.migrations.tracker import get_migration_files, get_pending_migrations
+from oxyde.migrations.utils import list_migration_files, parse_query_column
 
 # =============================================================================
 # Generator Tests
@@ -669,6 +672,53 @@ class TestMigrationTracker:
         assert len(files) == 1
         assert files[0].name == "0001_migration.py"
 
+    def test_listing_cached_until_directory_changes(self, tmp_path: Path):
+        """Test that the file listing is reused while the dir mtime is unchanged."""
+
+        (tmp_path / "0001_first.py").write_text("")
+        settled = 1_000_000_000_000_000_000
+        os.utime(tmp_path, ns=(settled, settled))
+        assert [f.name for f in list_migration_files(tmp_path)] == ["0001_first.py"]
+
+        # Same mtime: the cached listing is served
+        (tmp_path / "0002_second.py").write_text("")
+        os.utime(tmp_path, ns=(settled, settled))
+        assert [f.name for f in list_migration_files(tmp_path)] == ["0001_first.py"]
+
+        os.utime(tmp_path, ns=(settled + 1, settled + 1))
+        assert [f.name for f in list_migration_files(tmp_path)] == [
+            "0001_first.py",
+            "0002_second.py",
+        ]
+
+    def test_recently_changed_listing_not_cached(self, tmp_path: Path):
+        """Test that a listing taken right after a change is re-read next time."""
+
+        (tmp_path / "0001_first.py").write_text("")
+        mtime_ns = tmp_path.stat().st_mtime_ns
+        assert len(list_migration_files(tmp_path)) == 1
+
+        # A file created within the same timestamp tick keeps the mtime
+        (tmp_path / "0002_second.py").write_text("")
+        os.utime(tmp_path, ns=(mtime_ns, mtime_ns))
+        assert len(list_migration_files(tmp_path)) == 2
+
+    def test_parse_query_column_reads_columnar_rows(self):
+        """Test extracting one column from a [columns, rows] result."""
+
+        result = msgpack.packb([["id", "name"], [[1, "0001_initial"], [2, "0002_b"]]])
+
+        assert parse_query_column(result, "name") == ["0001_initial", "0002_b"]
+        assert parse_query_column(result, "missing") == []
+        assert parse_query_column(b"", "name") == []
+
+    def test_parse_query_column_accepts_row_dicts(self):
+        """Test the list-of-dicts fallback format."""
+
+        result = msgpack.packb([{"name": "0001_initial"}, {"other": 1}])
+
+        assert parse_query_column(result, "name") == ["0001_initial"]
+
     def test_get_pending_migrations(self, tmp_path: Path):
         """Test getting pending migrations."""
 
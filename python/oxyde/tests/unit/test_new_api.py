@@ -101,6 +101,33 @@ def test_query_introspection():
     assert query_ir["op"] == "select"
 
 
+@pytest.mark.parametrize(
+    ("query", "where"),
+    [
+        (
+            lambda: SampleModel.objects.filter(Q(status="active") | Q(age__lt=18)),
+            'WHERE "status" = ? OR "age" < ?',
+        ),
+        (
+            lambda: SampleModel.objects.exclude(status="active", views__lt=10),
+            'WHERE NOT ("status" = ? AND "views" < ?)',
+        ),
+        (
+            lambda: SampleModel.objects.filter(name__icontains="o"),
+            'WHERE LOWER("name") LIKE ?',
+        ),
+        (
+            lambda: SampleModel.objects.filter(~Q(status="active"), age__gte=18),
+            'WHERE (NOT "status" = ?) AND "age" >= ?',
+        ),
+    ],
+)
+def test_filters_compile_into_where(query, where):
+    """Q / exclude / lookups are pushed down into a single SQL WHERE."""
+    sql, _ = query().sql(dialect="sqlite")
+    assert sql.endswith(where)
+
+
 def test_query_methods():
     """Test that new query methods exist."""
     # Get the query builder via Manager.query()
@@ -45,6 +45,8 @@ class TestPoolSettings:
         assert settings.sqlite_synchronous == "NORMAL"
         assert settings.sqlite_cache_size == 10000
         assert settings.sqlite_busy_timeout == 5000
+        assert settings.sqlite_temp_store == "MEMORY"
+        assert settings.sqlite_read_connections is None
 
     def test_custom_settings(self):
         """Test PoolSettings with custom values."""
@@ -107,6 +109,26 @@ class TestPoolSettings:
         assert payload["sqlite_synchronous"] == "FULL"
         assert payload["sqlite_cache_size"] == 5000
         assert payload["sqlite_busy_timeout"] == 10000
+        assert "sqlite_read_connections" not in payload
+
+    def test_to_payload_rejects_unknown_sqlite_pragma_value(self):
+        """Test settings cannot smuggle SQL into the PRAGMA script."""
+        settings = PoolSettings(sqlite_journal_mode="WAL; DROP TABLE users")
+
+        with pytest.raises(ValueError, match="sqlite_journal_mode"):
+            settings.to_payload()
+
+    def test_to_payload_sqlite_read_connections(self):
+        """Test to_payload() includes the SQLite read pool size when set."""
+        payload = PoolSettings(sqlite_read_connections=4).to_payload()
+
+        assert payload["sqlite_read_connections"] == 4
+
+    def test_to_payload_sqlite_statement_cache_capacity(self):
+        """Test to_payload() includes the SQLite statement cache size when set."""
+        payload = PoolSettings(sqlite_statement_cache_capacity=256).to_payload()
+
+        assert payload["sqlite_statement_cache_capacity"] == 256
 
     def test_to_payload_transaction_settings(self):
         """Test to_payload() includes transaction settings."""
@@ -264,6 +286,60 @@ class TestAsyncDatabaseInit:
 
         assert db.settings.max_connections == 5
 
+    def test_init_sqlite_url_pragmas(self):
+        """Test PRAGMA query parameters override settings and leave the URL."""
+        settings = PoolSettings(max_connections=5)
+        db = AsyncDatabase(
+            url="sqlite:///test.db?mode=rwc&journal_mode=DELETE&cache_size=-64000",
+            name="test",
+            settings=settings,
+            auto_register=False,
+        )
+
+        assert db.url == "sqlite:///test.db?mode=rwc"
+        assert db.settings.sqlite_journal_mode == "DELETE"
+        assert db.settings.sqlite_cache_size == -64000
+        assert db.settings.max_connections == 5
+        # Caller's settings object is not mutated
+        assert settings.sqlite_journal_mode == "WAL"
+
+    def test_init_sqlite_url_invalid_pragma_value(self):
+        """Test non-numeric value for an integer PRAGMA raises."""
+        with pytest.raises(ValueError, match="busy_timeout"):
+            AsyncDatabase(
+                url="sqlite:///test.db?busy_timeout=soon",
+                name="test",
+                auto_register=False,
+            )
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "journal_mode=WAL%3BDROP%20TABLE%20users",
+            "synchronous=LOUD",
+            "temp_store=MEMORY;",
+        ],
+    )
+    def test_init_sqlite_url_rejects_unknown_pragma_value(self, query):
+        """Test string PRAGMAs only accept the values SQLite defines."""
+        with pytest.raises(ValueError, match="Invalid value for SQLite URL option"):
+            AsyncDatabase(
+                url=f"sqlite:///test.db?{query}",
+                name="test",
+                auto_register=False,
+            )
+
+    def test_init_sqlite_url_pragma_value_case_insensitive(self):
+        """Test PRAGMA values are accepted in any case."""
+        db = AsyncDatabase(
+            url="sqlite:///test.db?journal_mode=wal&synchronous=1",
+            name="test",
+            auto_register=False,
+        )
+
+        assert db.settings.sqlite_journal_mode == "wal"
+        assert db.settings.sqlite_synchronous == "1"
+
 
 class TestAsyncDatabaseConnect:
     """Test AsyncDatabase connect/disconnect lifecycle."""
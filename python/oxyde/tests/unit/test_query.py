@@ -547,6 +547,98 @@ async def test_values_list_execution_returns_expected_shapes() -> None:
     clear_registry()
 
 
+@pytest.mark.asyncio
+async def test_values_list_maps_db_columns_and_field_order() -> None:
+    clear_registry()
+
+    class Sample(Model):
+        id: int | None = Field(default=None, db_pk=True)
+        email: str = Field(db_column="email_address")
+
+        class Meta:
+            is_table = True
+
+    stub_flat = StubExecuteClient([(["email_address"], [["a"], ["b"]])])
+    flat_result = await Sample.objects.values_list("email", flat=True).fetch_all(
+        stub_flat
+    )
+    assert flat_result == ["a", "b"]
+
+    # Row order follows the requested fields, not the column order
+    stub_tuple = StubExecuteClient([(["id", "email_address"], [[1, "a"]])])
+    tuple_result = await Sample.objects.values_list("email", "id").fetch_all(
+        stub_tuple
+    )
+    assert tuple_result == [("a", 1)]
+
+    # A single non-flat field still yields 1-tuples
+    stub_single = StubExecuteClient([(["id", "email_address"], [[1, "a"]])])
+    single_result = await Sample.objects.values_list("email").fetch_all(stub_single)
+    assert single_result == [("a",)]
+
+    clear_registry()
+
+
+def test_values_list_selects_only_requested_columns() -> None:
+    clear_registry()
+
+    class Sample(Model):
+        id: int | None = Field(default=None, db_pk=True)
+        name: str
+        email: str = Field(db_column="email_address")
+
+        class Meta:
+            is_table = True
+
+    sql, params = (
+        Sample.objects.filter(name="a")
+        .values_list("email", flat=True)
+        .sql(dialect="sqlite")
+    )
+    assert sql == (
+        'SELECT "sample"."email_address" AS "email_address" FROM "sample" '
+        'WHERE "name" = ?'
+    )
+    assert params == ["a"]
+
+    clear_registry()
+
+
+@pytest.mark.asyncio
+async def test_iterator_yields_rows_in_each_result_mode() -> None:
+    clear_registry()
+
+    class Sample(Model):
+        id: int | None = Field(default=None, db_pk=True)
+        email: str
+
+        class Meta:
+            is_table = True
+
+    stub = StubExecuteClient(
+        [
+            (["id", "email"], [[1, "a"], [2, "b"]]),
+            (["id", "email"], [[1, "a"], [2, "b"]]),
+            (["id", "email"], [[1, "a"]]),
+        ]
+    )
+    dicts = [
+        row async for row in Sample.objects.values("id", "email").iterator(client=stub)
+    ]
+    assert dicts == [{"id": 1, "email": "a"}, {"id": 2, "email": "b"}]
+
+    tuples = [
+        row
+        async for row in Sample.objects.values_list("id", "email").iterator(client=stub)
+    ]
+    assert tuples == [(1, "a"), (2, "b")]
+
+    models = [obj async for obj in Sample.objects.filter().iterator(client=stub)]
+    assert [(m.id, m.email) for m in models] == [(1, "a")]
+
+    clear_registry()
+
+
 def test_f_expression_serialization() -> None:
     from oxyde.queries.expressions import _serialize_value_for_ir
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import msgpack
 import pytest
 
@@ -515,6 +517,56 @@ class TestPrefetchRelations:
         assert tasks[0].notes[0].text == "Note 1"
 
 
+    @pytest.mark.asyncio
+    async def test_failed_prefetch_cancels_other_groups(self):
+        """Test a failing prefetch path stops the concurrent ones."""
+
+        class Memo(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            job_id: int = 0
+
+            class Meta:
+                is_table = True
+
+        class Label(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            job_id: int = 0
+
+            class Meta:
+                is_table = True
+
+        class Job(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            memos: list[Memo] = Field(db_reverse_fk="job_id")
+            labels: list[Label] = Field(db_reverse_fk="job_id")
+
+            class Meta:
+                is_table = True
+
+        class FailingClient:
+            def __init__(self):
+                self.calls = 0
+                self.cancelled = False
+
+            async def execute(self, ir):
+                self.calls += 1
+                if self.calls == 1:
+                    return msgpack.packb((["id"], [[1]]))
+                if self.calls == 2:
+                    raise RuntimeError("prefetch failed")
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+
+        client = FailingClient()
+        with pytest.raises(RuntimeError, match="prefetch failed"):
+            await Job.objects.prefetch("memos", "labels").fetch_models(client)
+
+        assert client.calls == 3
+        assert client.cancelled
+
 class TestSelfReferentialRelations:
     """Test self-referential relations."""
 
@@ -584,6 +636,101 @@ class TestFKSerialization:
         assert data["writer_id"] == 5
         assert data["title"] == "Test"
 
+    def test_update_dump_serializes_only_requested_fields(self):
+        """UPDATE data holds just the requested real columns."""
+        from oxyde.models.serializers import _dump_update_data
+
+        class Reviewer(Model):
+            id: int | None = Field(default=None, db_pk=True)
+
+            class Meta:
+                is_table = True
+
+        class Review(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            title: str = ""
+            body: str | None = None
+            reviewer: Reviewer | None = None
+
+            class Meta:
+                is_table = True
+
+        review = Review(id=1, title="T", body=None, reviewer_id=3)
+
+        assert _dump_update_data(review, {"body", "reviewer", "missing"}) == {
+            "body": None
+        }
+        assert _dump_update_data(review, {"reviewer"}) == {}
+
+    def test_update_dump_honors_field_serializers(self):
+        """Custom serializers still shape UPDATE values."""
+        from pydantic import field_serializer
+
+        from oxyde.models.serializers import _dump_update_data
+
+        class Slugged(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            slug: str = ""
+            tags: list[str] = Field(default_factory=list)
+
+            class Meta:
+                is_table = True
+
+            @field_serializer("slug")
+            def _lower_slug(self, value: str) -> str:
+                return value.lower()
+
+        item = Slugged(id=1, slug="Hello", tags=["a"])
+
+        assert _dump_update_data(item, {"slug", "tags"}) == {
+            "slug": "hello",
+            "tags": ["a"],
+        }
+
+    def test_update_dump_honors_nested_annotated_serializers(self):
+        """Serializers inside an Optional[Annotated[...]] still apply."""
+        from typing import Annotated
+
+        from pydantic import PlainSerializer
+
+        from oxyde.models.serializers import _dump_update_data
+
+        class Tagged(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            slug: Annotated[str, PlainSerializer(str.lower)] | None = None
+
+            class Meta:
+                is_table = True
+
+        item = Tagged(id=1, slug="HELLO")
+
+        assert _dump_update_data(item, ["slug"]) == {"slug": "hello"}
+
+    def test_virtual_fields_cached_until_metadata_reparsed(self):
+        """Virtual field names are reused until field_metadata is rebuilt."""
+        from oxyde.models.serializers import _get_virtual_fields
+
+        class Editor(Model):
+            id: int | None = Field(default=None, db_pk=True)
+
+            class Meta:
+                is_table = True
+
+        class Column(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            editor: Editor | None = None
+
+            class Meta:
+                is_table = True
+
+        first = _get_virtual_fields(Column)
+        assert first == frozenset({"editor"})
+        assert _get_virtual_fields(Column) is first
+
+        Column._parse_field_tags()
+        assert _get_virtual_fields(Column) is not first
+        assert _get_virtual_fields(Column) == first
+
 
 class TestRelationValidation:
     """Test relation validation."""
@@ -808,3 +955,67 @@ class TestNestedJoinHydration:
         assert users[0].profile.bio == "Developer"
         assert users[0].profile.country is not None
         assert users[0].profile.country.name == "USA"
+
+    @pytest.mark.asyncio
+    async def test_nested_join_hydrates_regardless_of_relation_order(self):
+        """Parents are hydrated before children even if listed after them."""
+
+        class Region(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            name: str = ""
+
+            class Meta:
+                is_table = True
+
+        class Office(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            city: str = ""
+            region: Region | None = None
+
+            class Meta:
+                is_table = True
+
+        class Employee(Model):
+            id: int | None = Field(default=None, db_pk=True)
+            name: str = ""
+            office: Office | None = None
+
+            class Meta:
+                is_table = True
+
+        registered_tables()
+
+        dedup_result = (
+            ["id", "name"],
+            [[1, "Alice"], [2, "Bob"]],
+            {
+                "office__region": {
+                    "columns": ["id", "name"],
+                    "data": {100: [100, "EMEA"]},
+                    "refs": [100, None],
+                },
+                "office": {
+                    "columns": ["id", "city"],
+                    "data": {10: [10, "Berlin"]},
+                    "refs": [10, None],
+                },
+            },
+        )
+
+        stub = StubExecuteClient([dedup_result])
+        query = Employee.objects.join("office").join("office__region")
+        employees = await query.fetch_models(stub)
+
+        assert employees[0].office is not None
+        assert employees[0].office.region is not None
+        assert employees[0].office.region.name == "EMEA"
+        assert employees[1].office is None
+
+        # A nested path alone registers its parent join first
+        query = Employee.objects.join("office__region")
+        assert [spec.path for spec in query._join_specs] == [
+            "office",
+            "office__region",
+        ]
+        employees = await query.fetch_models(StubExecuteClient([dedup_result]))
+        assert employees[0].office.region.name == "EMEA"
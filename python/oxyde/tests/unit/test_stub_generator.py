@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import ast
+import importlib
+import os
+import sys
 from datetime import date, datetime, time
 from decimal import Decimal
+from enum import Enum
+from pathlib import Path
 from uuid import UUID
 
 import pytest
@@ -14,9 +19,13 @@ from oxyde.codegen.stub_generator import (
     _assemble_imports,
     _extract_custom_methods,
     _extract_top_level_copyable,
-    _generate_create_params,
+    _generate_field_sections,
     _generate_filter_params,
+    _get_field_info,
     _get_python_type_name,
+    generate_model_stub,
+    generate_stub_for_file,
+    write_stubs,
 )
 
 
@@ -81,6 +90,17 @@ class TestGetPythonTypeName:
 
         assert _get_python_type_name(MyModel) == "MyModel"
 
+    def test_unhashable_annotation_bypasses_cache(self):
+        """Annotation objects that cannot be memoized are still rendered."""
+
+        class Marker:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __repr__(self) -> str:
+                return "Marker"
+
+        assert _get_python_type_name(Marker()) == "Marker"
+
 
 class TestExtractTopLevelCopyable:
     """Test extraction of imports and function stubs from model source."""
@@ -249,7 +269,7 @@ class TestGenerateFilterParams:
         # The resulting signature must stay syntactically valid
         ast.parse(f"def f(\n        self,\n        *args,\n{params}\n): ...\n")
 
-        create_params = _generate_create_params(Clashy)
+        _, _, create_params = _generate_field_sections(Clashy)
         assert "\n        client:" not in f"\n{create_params}"
         ast.parse(
             "def f(\n        self,\n        *,\n        instance=None,\n"
@@ -258,6 +278,71 @@ class TestGenerateFilterParams:
         )
 
 
+class TestGetFieldInfo:
+    """Test per-model caching of field introspection."""
+
+    def test_result_is_cached_per_model(self):
+        class Cached(Model):
+            id: int = Field(db_pk=True)
+            name: str = ""
+
+        info = _get_field_info(Cached)
+        assert info == {"id": (int, True), "name": (str, False)}
+        assert _get_field_info(Cached) is info
+
+    def test_model_rebuild_invalidates_entry(self):
+        """Resolving a forward reference replaces model_fields."""
+
+        class Early(Model):
+            id: int = Field(db_pk=True)
+            status: Status | None = None
+
+        class Status(Enum):
+            ON = "on"
+
+        stale = _get_field_info(Early)
+        Early.model_rebuild(_types_namespace={"Status": Status})
+
+        assert _get_field_info(Early) is not stale
+        assert _get_field_info(Early)["status"] == (Status, False)
+
+
+class TestGenerateModelStub:
+    """Test per-model caching of the rendered Query/Manager stub."""
+
+    def test_rendered_stub_is_reused(self):
+        class Rendered(Model):
+            id: int = Field(db_pk=True)
+            name: str = ""
+
+            class Meta:
+                is_table = True
+
+        stub = generate_model_stub(Rendered)
+        assert "class RenderedQuery(Query[Rendered]):" in stub
+        assert generate_model_stub(Rendered) is stub
+
+    def test_model_rebuild_rerenders(self):
+        """Resolving a forward reference replaces model_fields."""
+
+        class Rebuilt(Model):
+            id: int = Field(db_pk=True)
+            mode: Mode | None = None
+
+            class Meta:
+                is_table = True
+
+        class Mode(Enum):
+            ON = "on"
+
+        stale = generate_model_stub(Rebuilt)
+        Rebuilt.model_rebuild(_types_namespace={"Mode": Mode})
+
+        fresh = generate_model_stub(Rebuilt)
+        assert fresh is not stale
+        assert "mode: Mode | None = None," in fresh
+
+
 class TestExtractCustomMethods:
     """Test model-method stubbing."""
 
@@ -281,3 +366,92 @@ class TestExtractCustomMethods:
         assert len(renders) == 2
         assert all("@overload" in m for m in renders)
         assert any("def plain" in m for m in methods)
+
+
+class TestGenerateStubForFile:
+    """Test single-file stub generation."""
+
+    def test_uses_registered_models_without_reimporting(
+        self, tmp_path: Path, monkeypatch, capsys
+    ):
+        source = tmp_path / "stubbed_models.py"
+        source.write_text(
+            "from oxyde import Field, Model\n"
+            "\n"
+            "class Widget(Model):\n"
+            "    id: int = Field(db_pk=True)\n"
+            "    name: str = ''\n"
+            "\n"
+            "    class Meta:\n"
+            "        is_table = True\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "stubbed_models", raising=False)
+        monkeypatch.delitem(sys.modules, "temp_module", raising=False)
+        importlib.import_module("stubbed_models")
+
+        generate_stub_for_file(source)
+
+        assert "temp_module" not in sys.modules
+        stub = source.with_suffix(".pyi").read_text()
+        assert "class WidgetQuery(Query[Widget]):" in stub
+        assert capsys.readouterr().out == (
+            f"Generated stub: {source.with_suffix('.pyi')}\n"
+        )
+
+    def test_files_imported_one_after_another(self, tmp_path: Path, monkeypatch):
+        """Models imported from an earlier file never land in a later stub."""
+        monkeypatch.delitem(sys.modules, "temp_module", raising=False)
+        sources = {}
+        for stem, model_name in (("alpha", "Alpha"), ("beta", "Beta")):
+            source = tmp_path / f"{stem}.py"
+            source.write_text(
+                "from oxyde import Field, Model\n"
+                "\n"
+                f"class {model_name}(Model):\n"
+                "    id: int = Field(db_pk=True)\n"
+                "\n"
+                "    class Meta:\n"
+                "        is_table = True\n"
+                f"        table_name = 'stub_two_files_{stem}'\n"
+            )
+            sources[stem] = source
+
+        generate_stub_for_file(sources["alpha"])
+        generate_stub_for_file(sources["beta"])
+        generate_stub_for_file(sources["beta"])
+
+        alpha_stub = sources["alpha"].with_suffix(".pyi").read_text()
+        beta_stub = sources["beta"].with_suffix(".pyi").read_text()
+        assert "class AlphaQuery(Query[Alpha]):" in alpha_stub
+        assert "class BetaQuery(Query[Beta]):" in beta_stub
+        assert "Alpha" not in beta_stub
+
+
+class TestWriteStubs:
+    """Test writing generated stubs to disk."""
+
+    def test_writes_every_file_and_reports_in_order(self, tmp_path: Path, capsys):
+        mapping = {tmp_path / f"models_{i}.pyi": f"# stub {i}\n" for i in range(12)}
+
+        write_stubs(mapping)
+
+        for stub_path, content in mapping.items():
+            assert stub_path.read_text() == content
+        reported = capsys.readouterr().out.splitlines()
+        assert reported == [f"Generated stub: {p}" for p in mapping]
+
+    def test_unchanged_stub_is_not_rewritten(self, tmp_path: Path, capsys):
+        stub_path = tmp_path / "models.pyi"
+        stub_path.write_text("# stub\n")
+        os.utime(stub_path, ns=(0, 0))
+
+        write_stubs({stub_path: "# stub\n"})
+
+        assert stub_path.stat().st_mtime_ns == 0
+        assert capsys.readouterr().out == f"Stub unchanged: {stub_path}\n"
+
+        write_stubs({stub_path: "# stub v2\n"})
+
+        assert stub_path.read_text() == "# stub v2\n"
+        assert capsys.readouterr().out == f"Generated stub: {stub_path}\n"
@@ -9,10 +9,12 @@ import msgpack
 import pytest
 
 from oxyde import Field, Model
-from oxyde.db import atomic
+from oxyde.db import PoolSettings, atomic
 from oxyde.db.transaction import (
     _ACTIVE_TRANSACTIONS,
     AsyncTransaction,
+    AtomicTransactionContext,
+    TransactionTimeoutError,
     get_active_transaction,
 )
 @pytest.fixture
@@ -39,12 +41,26 @@ class DummyDatabase:
 
     def __init__(self, name: str = "default"):
         self.name = name
+        self.backend = None
         self._connected = True
 
     async def ensure_connected(self):
         pass
 
 
+class DummySqliteDatabase(DummyDatabase):
+    """Dummy SQLite database with a writer lock."""
+
+    def __init__(self, name: str = "default", busy_timeout: int | None = 5000):
+        super().__init__(name)
+        self.backend = "sqlite"
+        self.settings = PoolSettings(sqlite_busy_timeout=busy_timeout)
+        self._writer_lock = asyncio.Lock()
+
+    def _get_writer_lock(self) -> asyncio.Lock:
+        return self._writer_lock
+
+
 class MockTransactionModule:
     """Mock transaction module functions."""
 
@@ -448,3 +464,83 @@ class TestTransactionCleanup:
 
         # Both cleaned up
         assert get_active_transaction("default") is None
+
+
+class TestSqliteWriterQueue:
+    """Test that SQLite transactions on one database run one at a time."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_transactions_are_serialized(self, mock_tx):
+        """Test a second transaction begins only after the first one commits."""
+        db = DummySqliteDatabase()
+
+        async def work():
+            async with AtomicTransactionContext(database=db):
+                await asyncio.sleep(0)
+
+        await asyncio.gather(work(), work())
+
+        ops = [op for op, _ in mock_tx.calls]
+        assert ops == ["begin", "commit", "begin", "commit"]
+        assert not db._writer_lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_nested_atomic_does_not_requeue(self, mock_tx):
+        """Test savepoints reuse the held lock instead of waiting on it."""
+        db = DummySqliteDatabase()
+
+        async with AtomicTransactionContext(database=db):
+            async with AtomicTransactionContext(database=db):
+                assert db._writer_lock.locked()
+
+        assert ("release_savepoint", (1, "sp_2")) in mock_tx.calls
+        assert not db._writer_lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_lock_released_on_rollback(self, mock_tx):
+        """Test the writer lock is released when the transaction rolls back."""
+        db = DummySqliteDatabase()
+
+        with pytest.raises(ValueError):
+            async with AsyncTransaction(db):
+                raise ValueError("boom")
+
+        assert ("rollback", 1) in mock_tx.calls
+        assert not db._writer_lock.locked()
+
+    @pytest.mark.asyncio
+    async def test_waiting_is_bounded_by_busy_timeout(self, mock_tx):
+        """Test waiting for the writer raises after sqlite_busy_timeout."""
+        db = DummySqliteDatabase(busy_timeout=10)
+
+        async with AsyncTransaction(db):
+            with pytest.raises(TransactionTimeoutError):
+                async with AsyncTransaction(db):
+                    pass
+
+        assert [op for op, _ in mock_tx.calls] == ["begin", "commit"]
+        await asyncio.sleep(0)
+        assert not db._writer_lock.locked()
+
+    def test_writer_lock_follows_event_loop(self):
+        """Test each event loop gets its own writer lock."""
+        from oxyde.db.pool import AsyncDatabase
+
+        db = AsyncDatabase(
+            "sqlite::memory:", name="writer_lock_loops", auto_register=False
+        )
+
+        async def contend() -> asyncio.Lock:
+            lock = db._get_writer_lock()
+            assert db._get_writer_lock() is lock
+            async with lock:
+                waiter = asyncio.ensure_future(lock.acquire())
+                await asyncio.sleep(0)
+            await waiter
+            lock.release()
+            return lock
+
+        first = asyncio.run(contend())
+        second = asyncio.run(contend())
+
+        assert first is not second
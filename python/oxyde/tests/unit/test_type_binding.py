@@ -173,6 +173,7 @@ OPERATOR_CASES = [
     ("endswith", {"name__endswith": "ce"}, [("String", "%ce")]),
     ("in_int", {"age__in": [20, 30, 40]}, [("BigInt", 20), ("BigInt", 30), ("BigInt", 40)]),
     ("in_str", {"name__in": ["Alice", "Bob"]}, [("String", "Alice"), ("String", "Bob")]),
+    ("in_uuid", {"uuid_val__in": [U, None]}, [("Uuid", str(U)), ("Uuid", None)]),
 ]
 
 